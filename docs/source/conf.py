@@ -23,24 +23,29 @@ extensions = [
     "sphinx.ext.intersphinx",
     "sphinx.ext.viewcode",
     "sphinx.ext.githubpages",
-    "sphinx_autodoc_typehints",
     "myst_parser",
 ]
 
 # Autosummary settings
 autosummary_generate = True
-autosummary_imported_members = True
+autosummary_imported_members = False
+# Keep existing stubs (and their mtimes) so incremental builds skip them
+autosummary_generate_overwrite = False
 
-# Autodoc settings - don't fail on import errors during doc build
-autodoc_mock_imports = [
+# Autodoc settings - don't fail on import errors during doc build. Autodoc's
+# mock finder sits first on sys.meta_path, so these names never reach a real
+# import attempt; bare sys.modules stubs would also hide the mock attributes
+# (and package __path__) that ``from x import y`` in documented code relies on.
+autodoc_mock_imports = (
     "world_anvil_mcp",
     "httpx",
+    "orjson",
     "pydantic",
     "mcp",
     "tenacity",
     "respx",
     "faker",
-]
+)
 
 # Source suffixes
 source_suffix = {
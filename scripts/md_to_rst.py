@@ -5,33 +5,213 @@ This script automatically transpiles .md files from various docs folders
 into .rst files in the appropriate Sphinx documentation structure.
 
 Usage:
-    python scripts/md_to_rst.py
+    python scripts/md_to_rst.py [--verbose]
 """
 
+import hashlib
+import json
+import os
+import re
+import shutil
 import subprocess
 import sys
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
 from pathlib import Path
-from typing import Dict, List
 
+PROJECT_ROOT = Path(__file__).parent.parent
+DOCS_ROOT = PROJECT_ROOT / "docs"
+SPHINX_SOURCE = DOCS_ROOT / "source"
 
-def check_pandoc() -> bool:
+# Source content hashes from the last successful run; cleaned with docs/build
+CACHE_FILE = DOCS_ROOT / "build" / ".md_to_rst_cache.json"
+
+# Category name, markdown source directory (under docs/), and Sphinx
+# destination directory (under docs/source/)
+DOC_CATEGORIES = [
+    ("workflows", "workflows", "workflows"),
+    ("quality", "quality", "development/quality"),
+    ("research", "research", "research"),
+    ("specs", "specs", "specs"),
+]
+
+# Pandoc invocation shared by the batch and per-file paths (--wrap=none: no line wrapping)
+PANDOC_ARGS = ["pandoc", "-f", "markdown", "-t", "rst", "--wrap=none"]
+
+# Paragraph inserted between documents in a batch; survives conversion verbatim
+BATCH_SENTINEL = "CD985272F78311"
+
+# Markdown that pandoc renders as definitions at the end of the RST document:
+# footnotes, images (emitted as substitutions) and reference-style link or
+# image definitions. In a batch those would land in the last file's slice.
+UNBATCHABLE = re.compile(r"\[\^|!\[|^ {0,3}\[[^\]]+\]:", re.MULTILINE)
+
+# ATX heading text, or a line underlined as a setext heading
+HEADING = re.compile(r"^ {0,3}#{1,6}[ \t]+(.*)$|^(.+)\n {0,3}(?:=+|-+)[ \t]*$", re.MULTILINE)
+
+# Link targets and attribute blocks, which never contribute to a heading's ID
+HEADING_MARKUP = re.compile(r"\]\([^)]*\)|\{[^}]*\}")
+
+
+def check_pandoc(verbose: bool = False) -> bool:
     """Check if pandoc is installed and available.
 
+    Only looks pandoc up on PATH; the version banner costs an extra pandoc
+    startup, so it is fetched only when verbose output is requested.
+
+    Args:
+        verbose: Print the installed pandoc version.
+
     Returns:
         True if pandoc is available, False otherwise.
     """
-    try:
+    if shutil.which("pandoc") is None:
+        return False
+
+    if verbose:
         result = subprocess.run(
             ["pandoc", "--version"],
             capture_output=True,
             text=True,
-            check=True,
+            check=False,
         )
         print(f"✓ Found {result.stdout.splitlines()[0]}")
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
+
+    return True
+
+
+def _digest(md_file: Path) -> str:
+    """Hash markdown source content for the conversion cache.
+
+    Args:
+        md_file: Path to source .md file
+
+    Returns:
+        Hex digest of the file contents.
+    """
+    return hashlib.blake2b(md_file.read_bytes(), digest_size=16).hexdigest()
+
+
+def _load_cache() -> dict[str, str]:
+    """Load source hashes recorded by the previous run.
+
+    Returns:
+        Dictionary mapping source paths (relative to the project root) to digests.
+    """
+    try:
+        return json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _save_cache(cache: dict[str, str]) -> None:
+    """Persist source hashes for the next run.
+
+    Args:
+        cache: Dictionary mapping source paths to digests.
+    """
+    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    CACHE_FILE.write_text(json.dumps(cache, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def _cache_key(md_file: Path) -> str:
+    """Build the conversion cache key for a source file.
+
+    Args:
+        md_file: Path to source .md file
+
+    Returns:
+        Source path relative to the project root, in POSIX form.
+    """
+    return md_file.relative_to(PROJECT_ROOT).as_posix()
+
+
+def _is_up_to_date(md_file: Path, rst_file: Path, cache: dict[str, str]) -> bool:
+    """Check whether an existing RST file already reflects its markdown source.
+
+    The RST file is current if it is newer than the source, or, to tolerate
+    touched files and clock skew, if the source hash matches the cached one.
+
+    Args:
+        md_file: Path to source .md file
+        rst_file: Path to destination .rst file
+        cache: Source hashes from the previous run
+
+    Returns:
+        True if conversion can be skipped, False otherwise.
+    """
+    try:
+        if rst_file.stat().st_mtime >= md_file.stat().st_mtime:
+            return True
+    except FileNotFoundError:
         return False
 
+    return cache.get(_cache_key(md_file)) == _digest(md_file)
+
+
+def _write_if_changed(rst_file: Path, content: bytes) -> None:
+    """Write RST output only when it differs from the file on disk.
+
+    Leaving identical files untouched preserves their mtime, so Sphinx's
+    incremental build does not treat them as changed.
+
+    Args:
+        rst_file: Path to destination .rst file
+        content: Converted RST as UTF-8 bytes
+    """
+    try:
+        if rst_file.read_bytes() == content:
+            return
+    except FileNotFoundError:
+        rst_file.parent.mkdir(parents=True, exist_ok=True)
+
+    rst_file.write_bytes(content)
+
+
+def _run_pandoc(md_file: Path, rst_file: Path) -> str | None:
+    """Run pandoc on a single markdown file without reporting.
+
+    Args:
+        md_file: Path to source .md file
+        rst_file: Path to destination .rst file
+
+    Returns:
+        None on success, otherwise pandoc's error output.
+    """
+    try:
+        # Convert using pandoc with Sphinx-friendly options. Output stays as
+        # bytes for the on-disk comparison; stderr is decoded only on failure.
+        result = subprocess.run(
+            [*PANDOC_ARGS, str(md_file)],
+            check=True,
+            capture_output=True,
+        )
+    except subprocess.CalledProcessError as e:
+        return e.stderr.decode("utf-8", errors="replace")
+
+    _write_if_changed(rst_file, result.stdout)
+    return None
+
+
+def _report(md_file: Path, rst_file: Path, error: str | None) -> bool:
+    """Print the outcome of a single file conversion.
+
+    Args:
+        md_file: Path to source .md file
+        rst_file: Path to destination .rst file
+        error: Error output from pandoc, or None if conversion succeeded
+
+    Returns:
+        True if conversion successful, False otherwise.
+    """
+    if error is None:
+        print(f"  ✓ {md_file.name} → {rst_file.relative_to(SPHINX_SOURCE)}")
+        return True
+
+    print(f"  ✗ Failed to convert {md_file.name}: {error}")
+    return False
+
 
 def convert_md_to_rst(md_file: Path, rst_file: Path) -> bool:
     """Convert a markdown file to reStructuredText using pandoc.
@@ -43,119 +223,251 @@ def convert_md_to_rst(md_file: Path, rst_file: Path) -> bool:
     Returns:
         True if conversion successful, False otherwise.
     """
-    try:
-        # Ensure output directory exists
-        rst_file.parent.mkdir(parents=True, exist_ok=True)
+    return _report(md_file, rst_file, _run_pandoc(md_file, rst_file))
+
+
+def _id_key(text: str) -> str:
+    """Reduce heading or link text to a coarse stand-in for pandoc's header ID.
+
+    The key keeps only letters and digits, from the first letter on, so it is
+    coarser than pandoc's ID: text that could produce the same ID always
+    produces the same key.
+
+    Args:
+        text: Heading or bracketed link text.
+
+    Returns:
+        Lowercase key; "section" when nothing is left, as in pandoc.
+    """
+    key = "".join(ch for ch in HEADING_MARKUP.sub("", text).lower() if ch.isalnum())
+    start = next((i for i, ch in enumerate(key) if ch.isalpha()), len(key))
+    return key[start:] or "section"
+
+
+def _heading_keys(text: str) -> tuple[set[str], set[str]]:
+    """Find what pandoc could link or renumber across documents in a batch.
+
+    Pandoc keeps header IDs unique across the whole input, so in a batch a
+    heading repeated from an earlier file gets an extra ``.. _overview-1:``
+    target. It also resolves ``[Heading text]`` to any header in the input,
+    so a bracketed phrase can turn into a link to another file's heading.
+    Neither happens when the file is converted on its own.
+
+    Args:
+        text: Markdown source.
+
+    Returns:
+        Tuple of (heading keys, including explicit ``{#id}`` attributes, and
+        keys of every bracketed span that could be a header reference).
+    """
+    headings = set()
+    for match in HEADING.finditer(text):
+        heading = match.group(1) or match.group(2)
+        headings.update(re.findall(r"\{#([^\s}]+)", heading))
+        headings.add(_id_key(heading))
+    references = {_id_key(span) for span in re.findall(r"\[([^\]\n]+)\]", text)}
+    return headings, references
 
-        # Convert using pandoc with Sphinx-friendly options
-        subprocess.run(
-            [
-                "pandoc",
-                str(md_file),
-                "-f",
-                "markdown",
-                "-t",
-                "rst",
-                "--wrap=none",  # Don't wrap lines
-                "-o",
-                str(rst_file),
-            ],
+
+def _split_batches(sources: list[tuple[Path, str]]) -> list[list[tuple[Path, str]]]:
+    """Group sources into batches whose documents cannot affect each other.
+
+    A source joins the first batch where its headings are new and neither its
+    bracketed spans nor the batch's could name a heading from the other side.
+    Files reusing common headings (Overview, Prerequisites, ...) spread over
+    several batches instead of falling back to one pandoc run each.
+
+    Args:
+        sources: (source, markdown) pairs in conversion order.
+
+    Returns:
+        Batches of (source, markdown) pairs, each in conversion order.
+    """
+    batches: list[tuple[list[tuple[Path, str]], set[str], set[str]]] = []
+    for src, text in sources:
+        headings, references = _heading_keys(text)
+        for batch, seen_headings, seen_references in batches:
+            fresh = seen_headings.isdisjoint(headings | references)
+            if fresh and seen_references.isdisjoint(headings):
+                batch.append((src, text))
+                seen_headings.update(headings)
+                seen_references.update(references)
+                break
+        else:
+            batches.append(([(src, text)], headings, references))
+    return [batch for batch, _, _ in batches]
+
+
+def _run_batch(batch: list[tuple[Path, str]]) -> dict[Path, str]:
+    """Convert one batch of markdown documents with a single pandoc invocation.
+
+    Args:
+        batch: (source, markdown) pairs with no heading keys in common.
+
+    Returns:
+        Dictionary mapping source paths to their RST output; empty if pandoc
+        failed or its output did not split back into one slice per file.
+    """
+    separator = f"\n\n{BATCH_SENTINEL}\n\n"
+    try:
+        result = subprocess.run(
+            PANDOC_ARGS,
+            input=separator.join(text for _, text in batch),
             check=True,
             capture_output=True,
             text=True,
+            encoding="utf-8",
         )
-        print(f"  ✓ {md_file.name} → {rst_file.relative_to(rst_file.parents[2])}")
-        return True
     except subprocess.CalledProcessError as e:
-        print(f"  ✗ Failed to convert {md_file.name}: {e.stderr}")
-        return False
+        print(f"  ⚠ Batch conversion failed, converting files individually: {e.stderr}")
+        return {}
+
+    slices = re.split(rf"^{BATCH_SENTINEL}$", result.stdout, flags=re.MULTILINE)
+    if len(slices) != len(batch):
+        # A sentinel was swallowed (e.g. by an unclosed code fence) or faked by
+        # a document; the slices cannot be matched to files reliably
+        print(
+            f"  ⚠ Batch output split into {len(slices)} parts for {len(batch)} files, "
+            "converting files individually"
+        )
+        return {}
 
+    return {src: rst.strip("\n") + "\n" for (src, _), rst in zip(batch, slices, strict=True)}
 
-def get_conversion_mappings() -> Dict[str, List[tuple[Path, Path]]]:
-    """Define which markdown files should be converted to which RST locations.
-
-    Returns:
-        Dictionary mapping category names to list of (source, destination) tuples.
-    """
-    project_root = Path(__file__).parent.parent
-    docs_root = project_root / "docs"
-    sphinx_source = docs_root / "source"
-
-    mappings = {
-        "workflows": [],
-        "quality": [],
-        "research": [],
-        "specs": [],
-    }
-
-    # Workflow documents (10 workflow .md files)
-    workflows_dir = docs_root / "workflows"
-    workflow_files = [
-        "d-and-d-campaign-setup.md",
-        "session-note-taking.md",
-        "npc-generation.md",
-        "location-development.md",
-        "quick-npc-lookup.md",
-        "world-building.md",
-        "map-management.md",
-        "quest-plot-management.md",
-        "session-prep.md",
-        "content-search.md",
-    ]
-
-    for workflow_file in workflow_files:
-        src = workflows_dir / workflow_file
-        if src.exists():
-            # Convert to .rst with same name
-            rst_name = workflow_file.replace(".md", ".rst")
-            dst = sphinx_source / "workflows" / rst_name
-            mappings["workflows"].append((src, dst))
-
-    # Quality standards documents
-    quality_dir = docs_root / "quality"
-    quality_files = [
-        "code-quality-rules.md",
-        "testing-requirements.md",
-        "documentation-standards.md",
-        "api-client-patterns.md",
-    ]
-
-    for quality_file in quality_files:
-        src = quality_dir / quality_file
-        if src.exists():
-            rst_name = quality_file.replace(".md", ".rst")
-            dst = sphinx_source / "development" / "quality" / rst_name
-            mappings["quality"].append((src, dst))
-
-    # Research documents
-    research_dir = docs_root / "research"
-    research_files = [
-        "world-anvil-platform-summary.md",
-        "pywaclient-analysis.md",
-    ]
-
-    for research_file in research_files:
-        src = research_dir / research_file
-        if src.exists():
-            rst_name = research_file.replace(".md", ".rst")
-            dst = sphinx_source / "research" / rst_name
-            mappings["research"].append((src, dst))
-
-    # Specification documents
-    specs_dir = docs_root / "specs"
-    specs_files = [
-        "tool-specifications.md",
-        "client-architecture.md",
-    ]
-
-    for specs_file in specs_files:
-        src = specs_dir / specs_file
-        if src.exists():
-            rst_name = specs_file.replace(".md", ".rst")
-            dst = sphinx_source / "specs" / rst_name
-            mappings["specs"].append((src, dst))
-
-    return mappings
+
+def _convert_batch(pairs: list[tuple[Path, Path]]) -> dict[Path, str]:
+    """Convert many markdown files with a few pandoc invocations.
+
+    Pandoc startup dominates the cost of converting a small document, so the
+    sources are concatenated with a sentinel paragraph between them, converted
+    together, and the RST output is split back apart on the sentinel. Files
+    sharing a heading go into different batches, so the output matches
+    converting each file on its own.
+
+    Files using footnotes, images or reference-style definitions are left out
+    of the batches because pandoc emits those at the end of the combined
+    document rather than per file.
+
+    ``pandoc server`` would also avoid repeated startups, but it needs a pandoc
+    build with server support and a free local port, and saves nothing once
+    the whole batch already runs in one process.
+
+    Args:
+        pairs: List of (source, destination) tuples to convert.
+
+    Returns:
+        Dictionary mapping source paths to their RST output. Sources missing
+        from the result (excluded, or their batch failed or did not split back
+        into one slice per file) should be converted individually.
+    """
+    batch: list[tuple[Path, str]] = []
+    for src, _ in pairs:
+        text = src.read_text(encoding="utf-8")
+        if not UNBATCHABLE.search(text):
+            batch.append((src, text))
+
+    # Batches are independent; run their pandoc processes concurrently
+    rendered: dict[Path, str] = {}
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for part in executor.map(_run_batch, _split_batches(batch)):
+            rendered.update(part)
+    return rendered
+
+
+def convert_all(conversions: Iterable[tuple[str, Path, Path]]) -> tuple[int, int, int]:
+    """Convert all discovered markdown files, batching them into few pandoc calls.
+
+    Files whose RST output is already up to date are skipped. Files the batch
+    could not handle are converted individually, in parallel.
+
+    Args:
+        conversions: (category, source, destination) tuples, grouped by category.
+
+    Returns:
+        Tuple of (converted, skipped, failed) file counts.
+    """
+    cache = _load_cache()
+    # The batch needs every stale file up front, so the iterator is drained once
+    entries = list(conversions)
+    stale = [(src, dst) for _, src, dst in entries if not _is_up_to_date(src, dst, cache)]
+    stale_sources = {src for src, _ in stale}
+    rendered = _convert_batch(stale)
+
+    # Files the batch did not cover are independent; run their pandoc
+    # processes concurrently and report in order once all have finished.
+    fallback = [(src, dst) for src, dst in stale if src not in rendered]
+    errors: dict[Path, str | None] = {}
+    if fallback:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = executor.map(lambda pair: _run_pandoc(*pair), fallback)
+            errors = {src: error for (src, _), error in zip(fallback, results, strict=True)}
+
+    converted = 0
+    skipped = 0
+    failed = 0
+
+    for category, group in groupby(entries, key=lambda entry: entry[0]):
+        print(f"🔄 Converting {category} documentation:")
+
+        for _, src, dst in group:
+            if src not in stale_sources:
+                print(f"  · {src.name} (unchanged)")
+                skipped += 1
+                continue
+
+            rst = rendered.get(src)
+            if rst is None:
+                ok = _report(src, dst, errors[src])
+            else:
+                _write_if_changed(dst, rst.encode("utf-8"))
+                ok = _report(src, dst, None)
+
+            if ok:
+                cache[_cache_key(src)] = _digest(src)
+                converted += 1
+            else:
+                failed += 1
+
+        print()
+
+    _save_cache(cache)
+    return converted, skipped, failed
+
+
+def _list_files(directory: Path) -> set[str]:
+    """List the names of regular files in a directory with a single scan.
+
+    Args:
+        directory: Directory to scan.
+
+    Returns:
+        Set of file names; empty if the directory does not exist.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
+
+def iter_conversions() -> Iterator[tuple[str, Path, Path]]:
+    """Discover which markdown files should be converted to which RST locations.
+
+    Every ``.md`` file (except ``README.md``) in each category's source
+    directory is converted, so new documents are picked up automatically.
+    Directories are scanned lazily, one category at a time.
+
+    Yields:
+        (category, source, destination) tuples, grouped by category.
+    """
+    for category, source_dir, dest_dir in DOC_CATEGORIES:
+        src_root = DOCS_ROOT / source_dir
+        dst_root = SPHINX_SOURCE / dest_dir
+        names = sorted(
+            name for name in _list_files(src_root) if name.endswith(".md") and name != "README.md"
+        )
+        for name in names:
+            yield category, src_root / name, dst_root / name.replace(".md", ".rst")
 
 
 def main() -> int:
@@ -167,7 +479,8 @@ def main() -> int:
     print("📝 Converting Markdown to reStructuredText for Sphinx...\n")
 
     # Check for pandoc
-    if not check_pandoc():
+    verbose = "--verbose" in sys.argv[1:]
+    if not check_pandoc(verbose=verbose):
         print("\n❌ Error: pandoc is not installed")
         print("\nInstall pandoc:")
         print("  macOS:   brew install pandoc")
@@ -178,30 +491,14 @@ def main() -> int:
 
     print()
 
-    # Get conversion mappings
-    mappings = get_conversion_mappings()
-
-    # Convert files by category
-    total_converted = 0
-    total_failed = 0
-
-    for category, files in mappings.items():
-        if not files:
-            continue
-
-        print(f"🔄 Converting {category} documentation:")
-
-        for src, dst in files:
-            if convert_md_to_rst(src, dst):
-                total_converted += 1
-            else:
-                total_failed += 1
-
-        print()
+    # Convert all discovered files in a few batched pandoc runs, reported by category
+    total_converted, total_skipped, total_failed = convert_all(iter_conversions())
 
     # Summary
     print("─" * 60)
     print(f"✅ Successfully converted: {total_converted} files")
+    if total_skipped > 0:
+        print(f"⏭️  Unchanged: {total_skipped} files")
     if total_failed > 0:
         print(f"❌ Failed: {total_failed} files")
         return 1
@@ -23,21 +23,23 @@ Safety:
 """
 
 import asyncio
+import io
 import os
 import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from world_anvil_mcp.client import WorldAnvilClient
-from world_anvil_mcp.exceptions import (
-    WorldAnvilAPIError,
-    WorldAnvilAuthError,
-    WorldAnvilNotFoundError,
-    WorldAnvilRateLimitError,
-)
+from world_anvil_mcp.exceptions import WorldAnvilAPIError, WorldAnvilNotFoundError
+
+# Upper bound on concurrent in-flight requests (API allows 60 per minute)
+MAX_CONCURRENT_REQUESTS = 8
 
 
 class LiveAPITester:
@@ -54,6 +56,14 @@ class LiveAPITester:
         self.user_token = os.getenv("WORLD_ANVIL_USER_TOKEN")
         self.created_articles: list[str] = []
         self.test_results: dict[str, dict] = {}
+        self._request_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        # Report text is collected here and written to stdout between tests
+        self._out = io.StringIO()
+
+        # One timestamp per run, shared by the banner and test article content
+        self._run_start = datetime.now()
+        self._timestamp_tag = self._run_start.strftime("%Y%m%d-%H%M%S")
 
         if not self.app_key or not self.user_token:
             raise ValueError(
@@ -66,323 +76,380 @@ class LiveAPITester:
         Returns:
             Test results dictionary with success/failure status
         """
-        print("\n" + "=" * 60)
-        print("World Anvil Live API Test Suite")
-        print("=" * 60)
-        print(f"World ID: {self.world_id}")
-        print(f"Timestamp: {datetime.now().isoformat()}")
-        print("=" * 60 + "\n")
-
-        async with WorldAnvilClient(
-            api_key=self.app_key,
-            user_token=self.user_token,
-        ) as client:
-            self.client = client
-
-            # Test sequence
-            await self._test_world_read()
-            await self._test_article_create()
-            await self._test_article_update()
-            await self._test_article_read()
-            await self._test_article_delete()
-            await self._test_error_handling()
-            await self._cleanup()
-
-        self._print_summary()
-        return self.test_results
-
-    async def _test_world_read(self) -> None:
-        """Validate world exists and is accessible."""
-        print("📖 Test 1: World Read Access")
-        print("-" * 60)
+        print("\n" + "=" * 60, file=self._out)
+        print("World Anvil Live API Test Suite", file=self._out)
+        print("=" * 60, file=self._out)
+        print(f"World ID: {self.world_id}", file=self._out)
+        print(f"Timestamp: {self._run_start.isoformat()}", file=self._out)
+        print("=" * 60 + "\n", file=self._out)
+        self._flush_output()
 
         try:
-            world = await self.client.get_world(self.world_id, granularity="1")
-            print(f"✅ World accessible: {world.get('name', 'N/A')}")
-            print(f"   ID: {world.get('id')}")
-            print(f"   Articles: {world.get('articleCount', 0)}")
-
-            self.test_results["world_read"] = {
-                "status": "PASS",
-                "world_name": world.get("name"),
-                "article_count": world.get("articleCount"),
-            }
-        except Exception as e:
-            print(f"❌ World read failed: {e}")
-            self.test_results["world_read"] = {"status": "FAIL", "error": str(e)}
-            raise  # Stop if world not accessible
+            async with WorldAnvilClient(
+                app_key=self.app_key,
+                user_token=self.user_token,
+            ) as client:
+                self.client = client
+
+                # The 404 probe does not depend on any other test; overlap it with
+                # the world read, which must still succeed before continuing
+                world_result, _ = await asyncio.gather(
+                    self._test_world_read(),
+                    self._test_error_handling(),
+                    return_exceptions=True,
+                )
+                self._flush_output()
+                if isinstance(world_result, BaseException):
+                    raise world_result
+
+                # Article lifecycle runs serially: each step needs the previous one
+                for step in (
+                    self._test_article_create,
+                    self._test_article_update,
+                    self._test_article_read,
+                    self._test_article_delete,
+                    self._cleanup,
+                ):
+                    await step()
+                    self._flush_output()
+
+            self._print_summary()
+        finally:
+            self._flush_output()
 
-        print()
+        return self.test_results
 
-    async def _test_article_create(self) -> None:
-        """Test article creation (PUT)."""
-        print("➕ Test 2: Article Creation (PUT)")
-        print("-" * 60)
+    @contextmanager
+    def _section(self, title: str) -> Iterator[io.StringIO]:
+        """Buffer one test's report so concurrent tests do not interleave.
 
-        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-        article_data = {
-            "title": f"MCP-TEST-Article-{timestamp}",
-            "content": "This is a test article created by the World Anvil MCP test suite.",
-            "state": "draft",  # Use draft to avoid publishing
-        }
+        Args:
+            title: Section heading printed above the test output
 
+        Yields:
+            Buffer the test writes its report lines to
+        """
+        out = io.StringIO()
+        print(title, file=out)
+        print("-" * 60, file=out)
         try:
-            # Note: Exact endpoint and parameters may need adjustment based on API docs
-            # This is a placeholder for the actual create article endpoint
-            result = await self.client._request(
-                method="PUT",
-                endpoint=f"world/{self.world_id}/article",
-                json=article_data,
-            )
+            yield out
+        finally:
+            print(file=out)
+            self._out.write(out.getvalue())
 
-            article_id = result.get("id")
-            if article_id:
-                self.created_articles.append(article_id)
-                print(f"✅ Article created successfully")
-                print(f"   ID: {article_id}")
-                print(f"   Title: {result.get('title')}")
+    def _flush_output(self) -> None:
+        """Write buffered report text to stdout in a single call."""
+        sys.stdout.write(self._out.getvalue())
+        sys.stdout.flush()
+        self._out = io.StringIO()
 
-                self.test_results["article_create"] = {
+    async def _test_world_read(self) -> None:
+        """Validate world exists and is accessible."""
+        with self._section("📖 Test 1: World Read Access") as out:
+            try:
+                world = await self.client.get_world(self.world_id, granularity=1)
+                print(f"✅ World accessible: {world.get('name', 'N/A')}", file=out)
+                print(f"   ID: {world.get('id')}", file=out)
+                print(f"   Articles: {world.get('articleCount', 0)}", file=out)
+
+                self.test_results["world_read"] = {
                     "status": "PASS",
-                    "article_id": article_id,
-                    "title": result.get("title"),
+                    "world_name": world.get("name"),
+                    "article_count": world.get("articleCount"),
                 }
-            else:
-                print("⚠️  Article created but no ID returned")
-                self.test_results["article_create"] = {
-                    "status": "PARTIAL",
-                    "note": "No ID in response",
-                }
-
-        except WorldAnvilAPIError as e:
-            print(f"❌ Article creation failed: {e}")
-            print(f"   Status code: {e.status_code if hasattr(e, 'status_code') else 'N/A'}")
-            self.test_results["article_create"] = {"status": "FAIL", "error": str(e)}
+            except Exception as e:
+                print(f"❌ World read failed: {e}", file=out)
+                self.test_results["world_read"] = {"status": "FAIL", "error": str(e)}
+                raise  # Stop if world not accessible
 
-        except Exception as e:
-            print(f"❌ Unexpected error: {e}")
-            self.test_results["article_create"] = {
-                "status": "FAIL",
-                "error": f"Unexpected: {e}",
+    async def _test_article_create(self) -> None:
+        """Test article creation (PUT)."""
+        with self._section("➕ Test 2: Article Creation (PUT)") as out:
+            article_data = {
+                "title": f"MCP-TEST-Article-{self._timestamp_tag}",
+                "content": "This is a test article created by the World Anvil MCP test suite.",
+                "state": "draft",  # Use draft to avoid publishing
             }
 
-        print()
+            try:
+                # Note: Exact endpoint and parameters may need adjustment based on API docs
+                # This is a placeholder for the actual create article endpoint
+                result = await self.client._request(
+                    method="PUT",
+                    path=f"/world/{self.world_id}/article",
+                    json=article_data,
+                )
+
+                article_id = result.get("id")
+                if article_id:
+                    self.created_articles.append(article_id)
+                    print(f"✅ Article created successfully", file=out)
+                    print(f"   ID: {article_id}", file=out)
+                    print(f"   Title: {result.get('title')}", file=out)
+
+                    self.test_results["article_create"] = {
+                        "status": "PASS",
+                        "article_id": article_id,
+                        "title": result.get("title"),
+                    }
+                else:
+                    print("⚠️  Article created but no ID returned", file=out)
+                    self.test_results["article_create"] = {
+                        "status": "PARTIAL",
+                        "note": "No ID in response",
+                    }
+
+            except WorldAnvilAPIError as e:
+                print(f"❌ Article creation failed: {e}", file=out)
+                status_code = e.status_code if hasattr(e, "status_code") else "N/A"
+                print(f"   Status code: {status_code}", file=out)
+                self.test_results["article_create"] = {"status": "FAIL", "error": str(e)}
+
+            except Exception as e:
+                print(f"❌ Unexpected error: {e}", file=out)
+                self.test_results["article_create"] = {
+                    "status": "FAIL",
+                    "error": f"Unexpected: {e}",
+                }
 
     async def _test_article_update(self) -> None:
         """Test article update (PATCH)."""
-        print("✏️  Test 3: Article Update (PATCH)")
-        print("-" * 60)
-
-        if not self.created_articles:
-            print("⚠️  Skipped: No article created in previous test")
-            self.test_results["article_update"] = {
-                "status": "SKIP",
-                "reason": "No article to update",
-            }
-            print()
-            return
+        with self._section("✏️  Test 3: Article Update (PATCH)") as out:
+            if not self.created_articles:
+                print("⚠️  Skipped: No article created in previous test", file=out)
+                self.test_results["article_update"] = {
+                    "status": "SKIP",
+                    "reason": "No article to update",
+                }
+                return
 
-        article_id = self.created_articles[0]
-        updated_content = "Updated content at " + datetime.now().isoformat()
+            article_id = self.created_articles[0]
+            updated_content = f"Updated content for run {self._timestamp_tag}"
 
-        try:
-            result = await self.client._request(
-                method="PATCH",
-                endpoint=f"world/{self.world_id}/article/{article_id}",
-                json={"content": updated_content},
-            )
+            try:
+                result = await self.client._request(
+                    method="PATCH",
+                    path=f"/world/{self.world_id}/article/{article_id}",
+                    json={"content": updated_content},
+                )
 
-            print(f"✅ Article updated successfully")
-            print(f"   ID: {article_id}")
-            print(f"   Updated content: {result.get('content', 'N/A')[:50]}...")
+                print(f"✅ Article updated successfully", file=out)
+                print(f"   ID: {article_id}", file=out)
+                content = result.get("content", "N/A")
+                print(f"   Updated content: {content[:50]}...", file=out)
 
-            self.test_results["article_update"] = {
-                "status": "PASS",
-                "article_id": article_id,
-            }
-
-        except Exception as e:
-            print(f"❌ Article update failed: {e}")
-            self.test_results["article_update"] = {"status": "FAIL", "error": str(e)}
+                self.test_results["article_update"] = {
+                    "status": "PASS",
+                    "article_id": article_id,
+                }
 
-        print()
+            except Exception as e:
+                print(f"❌ Article update failed: {e}", file=out)
+                self.test_results["article_update"] = {"status": "FAIL", "error": str(e)}
 
     async def _test_article_read(self) -> None:
         """Validate article can be read after creation/update."""
-        print("📖 Test 4: Article Read Verification")
-        print("-" * 60)
-
-        if not self.created_articles:
-            print("⚠️  Skipped: No article to read")
-            self.test_results["article_read"] = {
-                "status": "SKIP",
-                "reason": "No article created",
-            }
-            print()
-            return
+        with self._section("📖 Test 4: Article Read Verification") as out:
+            if not self.created_articles:
+                print("⚠️  Skipped: No article to read", file=out)
+                self.test_results["article_read"] = {
+                    "status": "SKIP",
+                    "reason": "No article created",
+                }
+                return
 
-        article_id = self.created_articles[0]
+            article_id = self.created_articles[0]
 
-        try:
-            # Verify cache invalidation by reading back
-            article = await self.client._request(
-                method="GET",
-                endpoint=f"world/{self.world_id}/article/{article_id}",
-                params={"granularity": "1"},
-            )
+            try:
+                # Verify cache invalidation by reading back
+                article = await self.client._request(
+                    method="GET",
+                    path=f"/world/{self.world_id}/article/{article_id}",
+                    params={"granularity": "1"},
+                )
 
-            print(f"✅ Article readable after update")
-            print(f"   Title: {article.get('title')}")
-            print(f"   State: {article.get('state', 'N/A')}")
+                print(f"✅ Article readable after update", file=out)
+                print(f"   Title: {article.get('title')}", file=out)
+                print(f"   State: {article.get('state', 'N/A')}", file=out)
 
-            self.test_results["article_read"] = {
-                "status": "PASS",
-                "article_id": article_id,
-                "title": article.get("title"),
-            }
-
-        except Exception as e:
-            print(f"❌ Article read failed: {e}")
-            self.test_results["article_read"] = {"status": "FAIL", "error": str(e)}
+                self.test_results["article_read"] = {
+                    "status": "PASS",
+                    "article_id": article_id,
+                    "title": article.get("title"),
+                }
 
-        print()
+            except Exception as e:
+                print(f"❌ Article read failed: {e}", file=out)
+                self.test_results["article_read"] = {"status": "FAIL", "error": str(e)}
 
     async def _test_article_delete(self) -> None:
         """Test article deletion (DELETE)."""
-        print("🗑️  Test 5: Article Deletion (DELETE)")
-        print("-" * 60)
-
-        if not self.created_articles:
-            print("⚠️  Skipped: No article to delete")
-            self.test_results["article_delete"] = {
-                "status": "SKIP",
-                "reason": "No article created",
-            }
-            print()
-            return
-
-        article_id = self.created_articles[0]
-
-        try:
-            await self.client._request(
-                method="DELETE",
-                endpoint=f"world/{self.world_id}/article/{article_id}",
-            )
+        with self._section("🗑️  Test 5: Article Deletion (DELETE)") as out:
+            if not self.created_articles:
+                print("⚠️  Skipped: No article to delete", file=out)
+                self.test_results["article_delete"] = {
+                    "status": "SKIP",
+                    "reason": "No article created",
+                }
+                return
 
-            print(f"✅ Article deleted successfully")
-            print(f"   ID: {article_id}")
+            article_id = self.created_articles[0]
 
-            # Verify deletion by attempting read
             try:
                 await self.client._request(
-                    method="GET",
-                    endpoint=f"world/{self.world_id}/article/{article_id}",
+                    method="DELETE",
+                    path=f"/world/{self.world_id}/article/{article_id}",
                 )
-                print("⚠️  Article still readable after deletion (unexpected)")
-                self.test_results["article_delete"] = {
-                    "status": "PARTIAL",
-                    "note": "Article still exists after DELETE",
-                }
-            except WorldAnvilNotFoundError:
-                print("✅ Verified: Article returns 404 after deletion")
-                self.test_results["article_delete"] = {
-                    "status": "PASS",
-                    "verified_404": True,
-                }
 
-            # Remove from cleanup list since deleted
-            self.created_articles.remove(article_id)
-
-        except Exception as e:
-            print(f"❌ Article deletion failed: {e}")
-            self.test_results["article_delete"] = {"status": "FAIL", "error": str(e)}
+                print(f"✅ Article deleted successfully", file=out)
+                print(f"   ID: {article_id}", file=out)
+
+                # Verify deletion by attempting read
+                try:
+                    await self.client._request(
+                        method="GET",
+                        path=f"/world/{self.world_id}/article/{article_id}",
+                    )
+                    print("⚠️  Article still readable after deletion (unexpected)", file=out)
+                    self.test_results["article_delete"] = {
+                        "status": "PARTIAL",
+                        "note": "Article still exists after DELETE",
+                    }
+                except WorldAnvilNotFoundError:
+                    print("✅ Verified: Article returns 404 after deletion", file=out)
+                    self.test_results["article_delete"] = {
+                        "status": "PASS",
+                        "verified_404": True,
+                    }
+
+                # Remove from cleanup list since deleted
+                self.created_articles.remove(article_id)
 
-        print()
+            except Exception as e:
+                print(f"❌ Article deletion failed: {e}", file=out)
+                self.test_results["article_delete"] = {"status": "FAIL", "error": str(e)}
 
     async def _test_error_handling(self) -> None:
         """Test error scenarios."""
-        print("🚨 Test 6: Error Handling")
-        print("-" * 60)
+        with self._section("🚨 Test 6: Error Handling") as out:
+            error_results = {}
 
-        error_results = {}
-
-        # Test 1: Invalid article ID (404)
-        try:
-            await self.client._request(
-                method="GET",
-                endpoint=f"world/{self.world_id}/article/invalid-id-12345",
-            )
-            error_results["404_handling"] = "FAIL - No 404 raised"
-        except WorldAnvilNotFoundError:
-            print("✅ 404 handling: Correctly raises NotFoundError")
-            error_results["404_handling"] = "PASS"
-        except Exception as e:
-            print(f"⚠️  404 handling: Unexpected error: {e}")
-            error_results["404_handling"] = f"PARTIAL - {type(e).__name__}"
+            # Test 1: Invalid article ID (404)
+            try:
+                await self.client._request(
+                    method="GET",
+                    path=f"/world/{self.world_id}/article/invalid-id-12345",
+                )
+                error_results["404_handling"] = "FAIL - No 404 raised"
+            except WorldAnvilNotFoundError:
+                print("✅ 404 handling: Correctly raises NotFoundError", file=out)
+                error_results["404_handling"] = "PASS"
+            except Exception as e:
+                print(f"⚠️  404 handling: Unexpected error: {e}", file=out)
+                error_results["404_handling"] = f"PARTIAL - {type(e).__name__}"
 
-        # Test 2: Invalid credentials (if safe to test)
-        # Skipped to avoid account issues
+            # Test 2: Invalid credentials (if safe to test)
+            # Skipped to avoid account issues
 
-        self.test_results["error_handling"] = error_results
-        print()
+            self.test_results["error_handling"] = error_results
 
     async def _cleanup(self) -> None:
         """Clean up any remaining test articles."""
-        print("🧹 Cleanup")
-        print("-" * 60)
+        with self._section("🧹 Cleanup") as out:
+            if not self.created_articles:
+                print("✅ No cleanup needed", file=out)
+                return
+
+            print(f"Cleaning up {len(self.created_articles)} test article(s)...", file=out)
+
+            # Deletions are independent; issue them concurrently, bounded so a
+            # large cleanup does not burst past the API rate limit
+            async with asyncio.TaskGroup() as tg:
+                tasks = {
+                    article_id: tg.create_task(self._delete_article(article_id))
+                    for article_id in self.created_articles
+                }
 
-        if not self.created_articles:
-            print("✅ No cleanup needed")
-            print()
-            return
+            for article_id, task in tasks.items():
+                error = task.result()
+                if error is not None:
+                    print(f"⚠️  Failed to delete {article_id}: {error}", file=out)
+                else:
+                    print(f"✅ Deleted article {article_id}", file=out)
+                    self.created_articles.remove(article_id)
+
+            if self.created_articles:
+                remaining = len(self.created_articles)
+                print(f"⚠️  {remaining} article(s) remain - manual cleanup needed", file=out)
+            else:
+                print("✅ All test articles cleaned up", file=out)
 
-        print(f"Cleaning up {len(self.created_articles)} test article(s)...")
+    async def _delete_article(self, article_id: str) -> Exception | None:
+        """Delete a test article, capturing failure instead of raising.
 
-        for article_id in self.created_articles[:]:
-            try:
-                await self.client._request(
-                    method="DELETE",
-                    endpoint=f"world/{self.world_id}/article/{article_id}",
-                )
-                print(f"✅ Deleted article {article_id}")
-                self.created_articles.remove(article_id)
-            except Exception as e:
-                print(f"⚠️  Failed to delete {article_id}: {e}")
+        Failures are returned rather than raised so one failed deletion does
+        not cancel the others running in the same task group.
+
+        Args:
+            article_id: Article ID to delete
+
+        Returns:
+            None on success, otherwise the exception raised by the request
+        """
+        try:
+            await self._bounded_request(
+                method="DELETE",
+                path=f"/world/{self.world_id}/article/{article_id}",
+            )
+        except Exception as e:
+            return e
+        return None
+
+    async def _bounded_request(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Issue a client request while holding a concurrency slot.
 
-        if self.created_articles:
-            print(f"⚠️  {len(self.created_articles)} article(s) remain - manual cleanup needed")
-        else:
-            print("✅ All test articles cleaned up")
+        Args:
+            method: HTTP method (GET, POST, PATCH, PUT, DELETE)
+            path: API endpoint path (e.g., "/identity")
+            params: Query parameters
+            json: JSON body for POST/PATCH/PUT
 
-        print()
+        Returns:
+            Response JSON as dictionary
+        """
+        async with self._request_slots:
+            return await self.client._request(method=method, path=path, params=params, json=json)
 
     def _print_summary(self) -> None:
-        """Print test summary."""
-        print("\n" + "=" * 60)
-        print("Test Summary")
-        print("=" * 60)
+        """Write the test summary to the report buffer."""
+        print("\n" + "=" * 60, file=self._out)
+        print("Test Summary", file=self._out)
+        print("=" * 60, file=self._out)
 
         total = len(self.test_results)
         passed = sum(1 for r in self.test_results.values() if r.get("status") == "PASS")
         failed = sum(1 for r in self.test_results.values() if r.get("status") == "FAIL")
-        skipped = sum(
-            1 for r in self.test_results.values() if r.get("status") == "SKIP"
-        )
+        skipped = sum(1 for r in self.test_results.values() if r.get("status") == "SKIP")
 
-        print(f"Total Tests: {total}")
-        print(f"✅ Passed: {passed}")
-        print(f"❌ Failed: {failed}")
-        print(f"⚠️  Skipped: {skipped}")
-        print()
+        print(f"Total Tests: {total}", file=self._out)
+        print(f"✅ Passed: {passed}", file=self._out)
+        print(f"❌ Failed: {failed}", file=self._out)
+        print(f"⚠️  Skipped: {skipped}", file=self._out)
+        print(file=self._out)
 
         for test_name, result in self.test_results.items():
             status = result.get("status", "UNKNOWN")
-            symbol = {"PASS": "✅", "FAIL": "❌", "SKIP": "⚠️", "PARTIAL": "⚠️"}.get(
-                status, "❓"
-            )
-            print(f"{symbol} {test_name}: {status}")
+            symbol = {"PASS": "✅", "FAIL": "❌", "SKIP": "⚠️", "PARTIAL": "⚠️"}.get(status, "❓")
+            print(f"{symbol} {test_name}: {status}", file=self._out)
 
-        print("=" * 60 + "\n")
+        print("=" * 60 + "\n", file=self._out)
 
 
 async def main():
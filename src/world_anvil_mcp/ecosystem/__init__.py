@@ -8,7 +8,7 @@ Key Components:
     - EcosystemDetector: Detects available companion MCPs
     - IntegrationTier: Priority levels (CRITICAL, RECOMMENDED, OPTIONAL)
     - CompanionMCP: Specification for companion integrations
-    - COMPANION_REGISTRY: Registry of known companions (6 total)
+    - COMPANION_REGISTRY: Immutable registry of known companions (6 total)
 
 Example:
     >>> from world_anvil_mcp.ecosystem import EcosystemDetector, IntegrationTier
@@ -19,13 +19,20 @@ Example:
 
 from __future__ import annotations
 
+import sys
+from bisect import bisect_left
+from collections.abc import Collection, Mapping
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum
+from functools import cached_property
+from types import MappingProxyType
 
 
-class IntegrationTier(Enum):
+class IntegrationTier(IntEnum):
     """Integration priority tiers for companion MCPs.
 
+    Tiers compare as integers, so they sort directly with CRITICAL first.
+
     Attributes:
         CRITICAL: Must detect, enables core workflows (Foundry VTT, Context Engine)
         RECOMMENDED: Should detect, enhances experience (Dropbox, Notion)
@@ -37,11 +44,16 @@ class IntegrationTier(Enum):
     OPTIONAL = 3  # May detect, nice to have
 
 
-@dataclass
+# Shared default for companions without workflow suggestions
+_NO_SUGGESTIONS: Mapping[str, str] = MappingProxyType({})
+
+
+@dataclass(slots=True, frozen=True)
 class CompanionMCP:
     """Specification for a companion MCP integration.
 
     Defines how to detect and integrate with companion MCPs in the ecosystem.
+    Instances are immutable; registry entries are shared by every detector.
 
     Attributes:
         name: Human-readable companion name
@@ -53,14 +65,14 @@ class CompanionMCP:
         can_read: Whether companion can read data
         can_write: Whether companion can write data
         bidirectional: Whether companion supports bidirectional sync
-        workflow_suggestions: Dict mapping workflow IDs to suggestion text
+        workflow_suggestions: Mapping of workflow IDs to suggestion text
 
     Example:
         >>> foundry = CompanionMCP(
         ...     name="Foundry VTT",
         ...     tier=IntegrationTier.CRITICAL,
         ...     description="Virtual tabletop",
-        ...     detection_tools=["foundry_get_actors"],
+        ...     detection_tools=frozenset({"foundry_get_actors"}),
         ...     use_cases=["Sync NPCs to actors"],
         ...     bidirectional=True,
         ... )
@@ -69,7 +81,7 @@ class CompanionMCP:
     name: str
     tier: IntegrationTier
     description: str
-    detection_tools: list[str]
+    detection_tools: frozenset[str]
     use_cases: list[str]
     documentation_url: str | None = None
 
@@ -78,24 +90,38 @@ class CompanionMCP:
     can_write: bool = False
     bidirectional: bool = False
 
-    # Workflow hints
-    workflow_suggestions: dict[str, str] = field(default_factory=dict)
+    # Workflow hints; companions without any share one read-only empty mapping
+    workflow_suggestions: Mapping[str, str] = field(default_factory=lambda: _NO_SUGGESTIONS)
 
+    # Markdown bullet for status reports, derived from name and description
+    _status_line: str = field(init=False, repr=False, compare=False)
 
-# Registry of known companion MCPs
-COMPANION_REGISTRY: list[CompanionMCP] = [
+    def __post_init__(self) -> None:
+        """Intern the name and format the status line; the instance is frozen afterwards.
+
+        Names key the detector's lookup dict; interning them lets lookups with
+        an interned name match by identity before comparing characters.
+        """
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "_status_line", f"- **{self.name}**: {self.description}")
+
+
+# Registry of known companion MCPs (immutable; detector indexes are derived from it)
+COMPANION_REGISTRY: tuple[CompanionMCP, ...] = (
     # Tier 1: Critical - Must detect, enables core workflows
     CompanionMCP(
         name="Foundry VTT",
         tier=IntegrationTier.CRITICAL,
         description="Virtual tabletop for live gameplay execution",
-        detection_tools=[
-            "foundry_get_actors",
-            "foundry_get_scenes",
-            "foundry_get_journal",
-            "foundry_roll_dice",
-            "foundry_update_actor",
-        ],
+        detection_tools=frozenset(
+            {
+                "foundry_get_actors",
+                "foundry_get_scenes",
+                "foundry_get_journal",
+                "foundry_roll_dice",
+                "foundry_update_actor",
+            }
+        ),
         use_cases=[
             "Sync NPCs to Foundry actors",
             "Import locations as scenes",
@@ -116,12 +142,14 @@ COMPANION_REGISTRY: list[CompanionMCP] = [
         name="Context Engine",
         tier=IntegrationTier.CRITICAL,
         description="Semantic search over TTRPG reference materials (SEPARATE PROJECT)",
-        detection_tools=[
-            "search_reference",
-            "get_srd_content",
-            "find_similar",
-            "generate_inspiration",
-        ],
+        detection_tools=frozenset(
+            {
+                "search_reference",
+                "get_srd_content",
+                "find_similar",
+                "generate_inspiration",
+            }
+        ),
         use_cases=[
             "Research D&D lore while creating content",
             "Find similar NPCs/locations for inspiration",
@@ -142,12 +170,14 @@ COMPANION_REGISTRY: list[CompanionMCP] = [
         name="Dropbox",
         tier=IntegrationTier.RECOMMENDED,
         description="Cloud storage for maps, handouts, and assets",
-        detection_tools=[
-            "dropbox_upload",
-            "dropbox_download",
-            "dropbox_list_folder",
-            "dropbox_search",
-        ],
+        detection_tools=frozenset(
+            {
+                "dropbox_upload",
+                "dropbox_download",
+                "dropbox_list_folder",
+                "dropbox_search",
+            }
+        ),
         use_cases=[
             "Store high-res battle maps",
             "Share handout documents",
@@ -165,11 +195,13 @@ COMPANION_REGISTRY: list[CompanionMCP] = [
         name="Notion",
         tier=IntegrationTier.RECOMMENDED,
         description="Project management for campaign meta-planning",
-        detection_tools=[
-            "notion_search",
-            "notion_create_page",
-            "notion_query_database",
-        ],
+        detection_tools=frozenset(
+            {
+                "notion_search",
+                "notion_create_page",
+                "notion_query_database",
+            }
+        ),
         use_cases=[
             "Track session prep checklists",
             "Manage content creation backlog",
@@ -188,10 +220,12 @@ COMPANION_REGISTRY: list[CompanionMCP] = [
         name="Discord",
         tier=IntegrationTier.OPTIONAL,
         description="Player communication and announcements",
-        detection_tools=[
-            "discord_send_message",
-            "discord_list_channels",
-        ],
+        detection_tools=frozenset(
+            {
+                "discord_send_message",
+                "discord_list_channels",
+            }
+        ),
         use_cases=[
             "Announce session times",
             "Share World Anvil links",
@@ -206,10 +240,12 @@ COMPANION_REGISTRY: list[CompanionMCP] = [
         name="Calendar",
         tier=IntegrationTier.OPTIONAL,
         description="Session scheduling",
-        detection_tools=[
-            "calendar_create_event",
-            "calendar_list_events",
-        ],
+        detection_tools=frozenset(
+            {
+                "calendar_create_event",
+                "calendar_list_events",
+            }
+        ),
         use_cases=[
             "Schedule game sessions",
             "Send reminders",
@@ -219,7 +255,26 @@ COMPANION_REGISTRY: list[CompanionMCP] = [
             "campaign_setup": "Schedule Session 0",
         },
     ),
-]
+)
+
+# Detection tool name -> companion it identifies. Tool names are unique across
+# the registry, so detection reduces to one set intersection.
+_TOOL_TO_COMPANION: dict[str, CompanionMCP] = {
+    tool: companion for companion in COMPANION_REGISTRY for tool in companion.detection_tools
+}
+
+# Same tool names as a set: set-to-set intersection iterates the smaller side
+_DETECTION_TOOLS: frozenset[str] = frozenset(_TOOL_TO_COMPANION)
+
+
+# Critical companions, reported as missing when not detected
+_CRITICAL_COMPANIONS: tuple[CompanionMCP, ...] = tuple(
+    c for c in COMPANION_REGISTRY if c.tier is IntegrationTier.CRITICAL
+)
+
+# Shared detectors keyed by tool set, oldest dropped first (see for_tools)
+_DETECTOR_CACHE: dict[frozenset[str], EcosystemDetector] = {}
+DETECTOR_CACHE_SIZE = 8
 
 
 class EcosystemDetector:
@@ -236,6 +291,9 @@ class EcosystemDetector:
     Attributes:
         available_tools: Set of tool names available in current MCP context
         _detected: Dict mapping companion names to CompanionMCP objects
+        _by_tier: Detected companions grouped by integration tier
+        _by_workflow: Workflow suggestions per workflow ID, sorted by tier
+        _workflow_ids: Sorted workflow IDs, for prefix queries
 
     Example:
         >>> detector = EcosystemDetector(available_tools=["foundry_get_actors"])
@@ -243,12 +301,14 @@ class EcosystemDetector:
         >>> print(detector.get_ecosystem_status())  # Markdown status report
     """
 
-    def __init__(self, available_tools: list[str]) -> None:
+    def __init__(self, available_tools: Collection[str]) -> None:
         """Initialize detector with available tool names.
 
         Args:
-            available_tools: List of tool names from MCP server context.
+            available_tools: Tool names from MCP server context.
                 These are the tools available across all registered MCPs.
+                A set or frozenset is used as is rather than copied, so it
+                should not be mutated while the detector is in use.
 
         Example:
             >>> tools = ["foundry_get_actors", "search_reference", "dropbox_upload"]
@@ -256,29 +316,70 @@ class EcosystemDetector:
             >>> len(detector.all_companions)
             3
         """
-        self.available_tools = set(available_tools)
+        self.available_tools: set[str] | frozenset[str] = (
+            available_tools
+            if isinstance(available_tools, (set, frozenset))
+            else set(available_tools)
+        )
         self._detected: dict[str, CompanionMCP] = {}
+        self._by_tier: dict[IntegrationTier, list[CompanionMCP]] = {}
+        self._by_workflow: dict[str, list[tuple[str, str, CompanionMCP]]] = {}
+        self._workflow_ids: list[str] = []
         self._detect_all()
 
-    def _detect_all(self) -> None:
-        """Detect all available companion MCPs by matching tools against registry."""
-        for companion in COMPANION_REGISTRY:
-            if self._is_available(companion):
-                self._detected[companion.name] = companion
+    @classmethod
+    def for_tools(cls, available_tools: Collection[str]) -> EcosystemDetector:
+        """Get a shared detector for a tool set, building it on first use.
 
-    def _is_available(self, companion: CompanionMCP) -> bool:
-        """Check if companion MCP is available based on tool presence.
-
-        A companion is considered available if ANY of its detection tools
-        are present in the available tools set.
+        Detectors are immutable once built, so callers that see the same tool
+        set (e.g. every request in one server session) can share one instead
+        of repeating detection. Up to DETECTOR_CACHE_SIZE tool sets are kept.
 
         Args:
-            companion: CompanionMCP to check availability
+            available_tools: Tool names from MCP server context.
 
         Returns:
-            True if at least one detection tool is available
+            Detector for the given tools, shared with other callers.
+
+        Example:
+            >>> tools = ["foundry_get_actors"]
+            >>> EcosystemDetector.for_tools(tools) is EcosystemDetector.for_tools(tools)
+            True
         """
-        return any(tool in self.available_tools for tool in companion.detection_tools)
+        key = frozenset(available_tools)
+        detector = _DETECTOR_CACHE.get(key)
+        if detector is None:
+            if len(_DETECTOR_CACHE) >= DETECTOR_CACHE_SIZE:
+                del _DETECTOR_CACHE[next(iter(_DETECTOR_CACHE))]
+            detector = _DETECTOR_CACHE[key] = cls(key)
+        return detector
+
+    def _detect_all(self) -> None:
+        """Detect all available companion MCPs by matching tools against registry.
+
+        A companion is considered available if ANY of its detection tools
+        are present in the available tools set. Detection results never change
+        after construction, so the tier and workflow indexes used by the query
+        methods are built here once.
+        """
+        hits = {_TOOL_TO_COMPANION[tool].name for tool in self.available_tools & _DETECTION_TOOLS}
+        if not hits:
+            return
+
+        # Walk the registry rather than the hits to keep registry order
+        for companion in COMPANION_REGISTRY:
+            if companion.name in hits:
+                self._detected[companion.name] = companion
+                self._by_tier.setdefault(companion.tier, []).append(companion)
+                for workflow, hint in companion.workflow_suggestions.items():
+                    self._by_workflow.setdefault(workflow, []).append(
+                        (companion.name, hint, companion)
+                    )
+
+        # Sort by tier (critical first); stable, so registry order breaks ties
+        for suggestions in self._by_workflow.values():
+            suggestions.sort(key=lambda x: x[2].tier)
+        self._workflow_ids = sorted(self._by_workflow)
 
     @property
     def critical_companions(self) -> list[CompanionMCP]:
@@ -298,7 +399,7 @@ class EcosystemDetector:
             >>> detector.critical_companions[0].name
             'Foundry VTT'
         """
-        return [c for c in self._detected.values() if c.tier == IntegrationTier.CRITICAL]
+        return list(self._by_tier.get(IntegrationTier.CRITICAL, ()))
 
     @property
     def all_companions(self) -> list[CompanionMCP]:
@@ -369,22 +470,67 @@ class EcosystemDetector:
             Foundry VTT: Sync tonight's NPCs to Foundry
             Notion: Check prep checklist in Notion
         """
+        return list(self._by_workflow.get(workflow, ()))
+
+    def suggest_for_workflow_prefix(
+        self,
+        prefix: str,
+    ) -> list[tuple[str, str, CompanionMCP]]:
+        """Get integration suggestions for every workflow ID starting with a prefix.
+
+        Matching IDs form one contiguous run of the sorted workflow IDs, found
+        by binary search, so the cost depends on the matches rather than on
+        the number of workflows.
+
+        Args:
+            prefix: Workflow ID prefix (e.g., "session_" for session_prep and
+                session_notes). An empty prefix matches every workflow.
+
+        Returns:
+            List of (companion_name, suggestion_text, companion_object) tuples,
+            sorted by integration tier (critical first), then by workflow ID
+
+        Example:
+            >>> detector = EcosystemDetector(["foundry_get_actors", "discord_send_message"])
+            >>> for name, hint, _ in detector.suggest_for_workflow_prefix("session_"):
+            ...     print(f"{name}: {hint}")
+            Foundry VTT: Import combat log from Foundry session
+            Foundry VTT: Sync tonight's NPCs and locations to Foundry
+            Discord: Post summary to Discord channel
+        """
+        ids = self._workflow_ids
+        start = bisect_left(ids, prefix)
         suggestions = []
-        for companion in self._detected.values():
-            if workflow in companion.workflow_suggestions:
-                suggestions.append(
-                    (
-                        companion.name,
-                        companion.workflow_suggestions[workflow],
-                        companion,
-                    )
-                )
+        for workflow in ids[start:]:
+            if not workflow.startswith(prefix):
+                break
+            suggestions.extend(self._by_workflow[workflow])
 
-        # Sort by tier (critical first)
-        suggestions.sort(key=lambda x: x[2].tier.value)
+        suggestions.sort(key=lambda x: x[2].tier)
         return suggestions
 
     def get_ecosystem_status(self) -> str:
+        """Get markdown status report of detected ecosystem.
+
+        The report only depends on detection results, which are fixed at
+        construction, so it is built on first use and reused afterwards.
+
+        Returns:
+            Markdown-formatted status string with tier-based sections
+
+        Example:
+            >>> detector = EcosystemDetector(["foundry_get_actors"])
+            >>> detector.get_ecosystem_status() is detector.get_ecosystem_status()
+            True
+        """
+        return self.ecosystem_status
+
+    @cached_property
+    def ecosystem_status(self) -> str:
+        """Markdown status report of detected ecosystem, built once per detector."""
+        return self._build_ecosystem_status()
+
+    def _build_ecosystem_status(self) -> str:
         """Generate markdown status report of detected ecosystem.
 
         Creates a comprehensive status report showing:
@@ -398,7 +544,7 @@ class EcosystemDetector:
 
         Example:
             >>> detector = EcosystemDetector(["foundry_get_actors"])
-            >>> print(detector.get_ecosystem_status())
+            >>> print(detector._build_ecosystem_status())
             ## 🔌 MCP Ecosystem Status
 
             ### ✅ Critical Integrations
@@ -407,40 +553,31 @@ class EcosystemDetector:
             ### ⚠️ Missing Critical Integrations
             - **Context Engine**: Semantic search over TTRPG reference materials
         """
-        lines = ["## 🔌 MCP Ecosystem Status\n"]
-
-        # Critical companions (detected and missing)
-        critical = [c for c in self._detected.values() if c.tier == IntegrationTier.CRITICAL]
-        missing_critical = [
-            c
-            for c in COMPANION_REGISTRY
-            if c.tier == IntegrationTier.CRITICAL and c.name not in self._detected
+        missing = [c for c in _CRITICAL_COMPANIONS if c.name not in self._detected]
+        missing_entries = [
+            f"{c._status_line}\n  - Install: {c.documentation_url}"
+            if c.documentation_url
+            else c._status_line
+            for c in missing
         ]
 
-        if critical:
-            lines.append("### ✅ Critical Integrations")
-            for c in critical:
-                lines.append(f"- **{c.name}**: {c.description}")
-
-        if missing_critical:
-            lines.append("\n### ⚠️ Missing Critical Integrations")
-            for c in missing_critical:
-                lines.append(f"- **{c.name}**: {c.description}")
-                if c.documentation_url:
-                    lines.append(f"  - Install: {c.documentation_url}")
-
-        # Recommended companions
-        recommended = [c for c in self._detected.values() if c.tier == IntegrationTier.RECOMMENDED]
-        if recommended:
-            lines.append("\n### 📦 Available Integrations")
-            for c in recommended:
-                lines.append(f"- **{c.name}**: {c.description}")
-
-        # Optional companions
-        optional = [c for c in self._detected.values() if c.tier == IntegrationTier.OPTIONAL]
-        if optional:
-            lines.append("\n### 🔧 Optional Integrations")
-            for c in optional:
-                lines.append(f"- **{c.name}**: {c.description}")
-
-        return "\n".join(lines)
+        # (header, entries) in display order; empty sections are left out
+        layout = (
+            ("### ✅ Critical Integrations", self._tier_entries(IntegrationTier.CRITICAL)),
+            ("### ⚠️ Missing Critical Integrations", missing_entries),
+            ("### 📦 Available Integrations", self._tier_entries(IntegrationTier.RECOMMENDED)),
+            ("### 🔧 Optional Integrations", self._tier_entries(IntegrationTier.OPTIONAL)),
+        )
+        sections = [header + "\n" + "\n".join(entries) for header, entries in layout if entries]
+        return "\n\n".join(["## 🔌 MCP Ecosystem Status", *sections])
+
+    def _tier_entries(self, tier: IntegrationTier) -> list[str]:
+        """Status report lines for the detected companions of one tier.
+
+        Args:
+            tier: Integration tier to list
+
+        Returns:
+            Markdown bullet per detected companion, in registry order
+        """
+        return [c._status_line for c in self._by_tier.get(tier, ())]
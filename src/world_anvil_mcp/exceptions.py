@@ -39,6 +39,10 @@ class WorldAnvilError(Exception):
         ...     handle_world_anvil_error(e)
     """
 
+    # Empty slots throughout the hierarchy: no per-class __weakref__ slot, and
+    # subclass attributes (status_code, retry_after) live in slots, not __dict__
+    __slots__ = ()
+
 
 class WorldAnvilAuthError(WorldAnvilError):
     """Authentication or authorization failure (401, 403).
@@ -60,6 +64,8 @@ class WorldAnvilAuthError(WorldAnvilError):
         ...     print("Invalid credentials provided")
     """
 
+    __slots__ = ()
+
 
 class WorldAnvilAPIError(WorldAnvilError):
     """General API error with optional HTTP status code.
@@ -83,6 +89,10 @@ class WorldAnvilAPIError(WorldAnvilError):
         ...     print(f"API error (HTTP {e.status_code}): {e}")
     """
 
+    # Keeps status_code out of a per-instance __dict__, which BaseException
+    # only allocates on demand
+    __slots__ = ("status_code",)
+
     def __init__(self, message: str, status_code: int | None = None) -> None:
         """Initialize WorldAnvilAPIError with message and optional status code.
 
@@ -93,6 +103,10 @@ class WorldAnvilAPIError(WorldAnvilError):
         super().__init__(message)
         self.status_code = status_code
 
+    def __reduce__(self) -> tuple[type[WorldAnvilAPIError], tuple[object, ...]]:
+        """Pickle with the status code, which BaseException only saves from __dict__."""
+        return (type(self), (*self.args, self.status_code))
+
 
 class WorldAnvilRateLimitError(WorldAnvilError):
     """Rate limit exceeded (429).
@@ -119,6 +133,9 @@ class WorldAnvilRateLimitError(WorldAnvilError):
         ...     await client.get_article(article_id)  # Retry
     """
 
+    # Keeps retry_after out of a per-instance __dict__
+    __slots__ = ("retry_after",)
+
     def __init__(self, message: str, retry_after: int = 60) -> None:
         """Initialize WorldAnvilRateLimitError with retry-after value.
 
@@ -129,6 +146,10 @@ class WorldAnvilRateLimitError(WorldAnvilError):
         super().__init__(message)
         self.retry_after = retry_after
 
+    def __reduce__(self) -> tuple[type[WorldAnvilRateLimitError], tuple[object, ...]]:
+        """Pickle with the retry delay, which BaseException only saves from __dict__."""
+        return (type(self), (*self.args, self.retry_after))
+
 
 class WorldAnvilNotFoundError(WorldAnvilError):
     """Resource not found (404).
@@ -149,6 +170,8 @@ class WorldAnvilNotFoundError(WorldAnvilError):
         ...     print("Article does not exist")
     """
 
+    __slots__ = ()
+
 
 class WorldAnvilValidationError(WorldAnvilError):
     """Request validation failed.
@@ -173,3 +196,5 @@ class WorldAnvilValidationError(WorldAnvilError):
         ... except WorldAnvilValidationError:
         ...     print("Invalid granularity (must be string '0'-'3')")
     """
+
+    __slots__ = ()
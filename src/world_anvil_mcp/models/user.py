@@ -33,7 +33,7 @@ class Identity(BaseModel):
     id: str = Field(..., description="User unique identifier")
     username: str = Field(..., description="Display username")
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", frozen=True)
 
 
 class User(BaseModel):
@@ -66,4 +66,4 @@ class User(BaseModel):
     membership: str | None = Field(None, description="Guild membership level")
     created_at: datetime | None = Field(None, description="Account creation date")
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", frozen=True)
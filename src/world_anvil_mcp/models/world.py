@@ -36,7 +36,7 @@ class WorldSummary(BaseModel):
     id: str = Field(..., description="World unique identifier")
     name: str = Field(..., description="World name")
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", frozen=True)
 
 
 class World(BaseModel):
@@ -81,4 +81,4 @@ class World(BaseModel):
     updated_at: datetime | None = Field(None, description="World last update date")
     owner: dict[str, Any] | None = Field(None, description="World owner information")
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", frozen=True)
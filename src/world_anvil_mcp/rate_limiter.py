@@ -0,0 +1,73 @@
+"""Token-bucket rate limiter for World Anvil API requests.
+
+World Anvil allows 60 requests per minute. Rather than reacting to 429
+responses (a wasted round trip plus a Retry-After stall), requests wait
+for a token before they are sent:
+- Bucket starts full, so short bursts go out immediately
+- Tokens refill continuously at rate / per seconds
+- Waiters are served in arrival order
+
+Thread Safety:
+    Safe for single-threaded async operations. An asyncio.Lock serializes
+    waiters; no thread locks are needed.
+
+Example:
+    >>> limiter = TokenBucket(rate=60, per=60.0)
+    >>> await limiter.acquire()  # Returns immediately while tokens remain
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Async token bucket allowing ``rate`` acquisitions per ``per`` seconds.
+
+    Performance:
+        - acquire(): O(1), awaits only when the bucket is empty
+        - Memory: O(1)
+
+    Attributes:
+        rate: Bucket capacity and tokens added per period.
+        per: Refill period in seconds.
+    """
+
+    def __init__(self, rate: int = 60, per: float = 60.0) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rate: Maximum requests per period. Defaults to 60.
+            per: Period length in seconds. Defaults to 60.0.
+
+        Example:
+            >>> limiter = TokenBucket(rate=10, per=1.0)
+        """
+        self._capacity = float(rate)
+        self._tokens = float(rate)
+        self._refill_per_second = rate / per
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill, up to capacity."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._tokens = min(self._capacity, self._tokens + elapsed * self._refill_per_second)
+        self._last_refill = now
+
+    async def acquire(self) -> None:
+        """Take one token, waiting for a refill if the bucket is empty.
+
+        Example:
+            >>> limiter = TokenBucket(rate=1, per=1.0)
+            >>> await limiter.acquire()  # Immediate
+            >>> await limiter.acquire()  # Waits about one second
+        """
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._refill_per_second)
+                self._refill()
+            self._tokens -= 1
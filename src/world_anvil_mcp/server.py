@@ -1,79 +1,172 @@
 """World Anvil MCP Server entry point.
 
 This module initializes and runs the FastMCP server with World Anvil integration.
+
+FastMCP and python-dotenv are imported on first use rather than at import
+time; importing FastMCP dominates cold start for stdio servers. The server
+instance is still available as ``server.mcp`` (built lazily, PEP 562).
 """
 
-import json
+from __future__ import annotations
+
 import os
-from typing import Any
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import orjson
+
+if TYPE_CHECKING:
+    from mcp.server.fastmcp import FastMCP
+
+# Same value as WorldAnvilClient.BASE_URL, repeated so that importing the
+# server does not pull in the client and httpx
+_DEFAULT_API_BASE = "https://www.worldanvil.com/api/external/boromir"
+
+
+@cache
+def _ensure_dotenv_loaded() -> None:
+    """Load variables from a .env file, at most once per process.
+
+    Deferred from import time so importing the package stays cheap.
+    """
+    from dotenv import load_dotenv  # noqa: PLC0415  # deferred for cold start
+
+    load_dotenv()
+
+
+class _EnvSnapshot(NamedTuple):
+    """World Anvil settings read from the environment."""
 
-from dotenv import load_dotenv
-from mcp.server.fastmcp import FastMCP
+    app_key: str | None
+    user_token: str | None
+    api_base: str
 
-# Load environment variables
-load_dotenv()
 
-# Initialize FastMCP server
-mcp = FastMCP(
-    name="World Anvil Assistant",
-)
+@lru_cache(maxsize=1)
+def _env_snapshot() -> _EnvSnapshot:
+    """Read the World Anvil environment variables once per process.
 
+    The environment does not change while the server runs; tests that
+    patch it call _reset_env_cache() to force a fresh read.
 
-@mcp.tool()
-async def get_api_status() -> dict[str, Any]:
+    Returns:
+        Snapshot of the credentials and API base URL
+    """
+    _ensure_dotenv_loaded()
+    return _EnvSnapshot(
+        app_key=os.getenv("WORLD_ANVIL_APP_KEY"),
+        user_token=os.getenv("WORLD_ANVIL_USER_TOKEN"),
+        api_base=os.getenv("WORLD_ANVIL_API_BASE", _DEFAULT_API_BASE),
+    )
+
+
+@lru_cache(maxsize=1)
+def _config_status_json(env: _EnvSnapshot) -> str:
+    """Serialize the configuration status resource once per environment snapshot.
+
+    Keyed on the snapshot's values. The snapshot is itself cached, so a
+    changed environment is only picked up after _reset_env_cache().
+
+    Args:
+        env: Environment snapshot to describe
+
+    Returns:
+        JSON string with configuration details
+    """
+    status = {
+        "server": "World Anvil MCP",
+        "version": "0.1.0",
+        "configured": bool(env.app_key and env.user_token),
+        "api_base": env.api_base,
+    }
+
+    return orjson.dumps(status, option=orjson.OPT_INDENT_2).decode()
+
+
+def _reset_env_cache() -> None:
+    """Drop the cached environment snapshot and everything derived from it."""
+    _env_snapshot.cache_clear()
+    _config_status_json.cache_clear()
+
+
+def get_api_status() -> dict[str, Any]:
     """Check World Anvil API connection status.
 
+    Synchronous: the status comes from the cached environment snapshot with
+    no I/O, so FastMCP calls it directly without creating a coroutine.
+
     Returns:
         Dictionary with API status information
     """
-    app_key = os.getenv("WORLD_ANVIL_APP_KEY")
-    user_token = os.getenv("WORLD_ANVIL_USER_TOKEN")
+    env = _env_snapshot()
 
     return {
-        "status": "ready" if (app_key and user_token) else "not_configured",
-        "has_app_key": bool(app_key),
-        "has_user_token": bool(user_token),
-        "api_base": os.getenv(
-            "WORLD_ANVIL_API_BASE", "https://www.worldanvil.com/api/external/boromir"
-        ),
+        "status": "ready" if (env.app_key and env.user_token) else "not_configured",
+        "has_app_key": bool(env.app_key),
+        "has_user_token": bool(env.user_token),
+        "api_base": env.api_base,
     }
 
 
-@mcp.resource("config://status")
 def get_config_status() -> str:
     """Expose server configuration status as a resource.
 
     Returns:
         JSON string with configuration details
     """
-    app_key = os.getenv("WORLD_ANVIL_APP_KEY")
-    user_token = os.getenv("WORLD_ANVIL_USER_TOKEN")
+    return _config_status_json(_env_snapshot())
 
-    status = {
-        "server": "World Anvil MCP",
-        "version": "0.1.0",
-        "configured": bool(app_key and user_token),
-        "api_base": os.getenv(
-            "WORLD_ANVIL_API_BASE", "https://www.worldanvil.com/api/external/boromir"
-        ),
-    }
 
-    return json.dumps(status, indent=2)
+@cache
+def _get_mcp() -> FastMCP:
+    """Build the FastMCP server and register its tools and resources, once.
+
+    Returns:
+        The process-wide FastMCP server instance
+    """
+    from mcp.server.fastmcp import FastMCP  # noqa: PLC0415  # deferred for cold start
+
+    server = FastMCP(
+        name="World Anvil Assistant",
+    )
+    server.tool()(get_api_status)
+    server.resource("config://status")(get_config_status)
+    return server
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Build the module-level ``mcp`` server on first access (PEP 562).
+
+    Args:
+        name: Attribute looked up on the module
+
+    Returns:
+        The FastMCP server for ``mcp``
+
+    Raises:
+        AttributeError: For any other missing attribute
+    """
+    if name == "mcp":
+        return _get_mcp()
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
 
 
 def main() -> None:
     """Run the MCP server."""
-    # Check for required environment variables
-    if not os.getenv("WORLD_ANVIL_APP_KEY"):
+    # Check for required environment variables; the snapshot (which loads
+    # .env) is the same one the tools and resources read afterwards
+    env = _env_snapshot()
+    if not env.app_key:
         print("Warning: WORLD_ANVIL_APP_KEY not set")
         print("Set it in .env or environment variables")
 
-    if not os.getenv("WORLD_ANVIL_USER_TOKEN"):
+    if not env.user_token:
         print("Warning: WORLD_ANVIL_USER_TOKEN not set")
         print("Set it in .env or environment variables")
 
     # Run the server
-    mcp.run()
+    _get_mcp().run()
 
 
 if __name__ == "__main__":
@@ -16,6 +16,14 @@ from mcp.types import TextContent
 from ..client import WorldAnvilClient
 from ..models.user import Identity, User
 
+# Profile lines for get_current_user as (label, User attribute, default);
+# a field that is empty and has no default is left out
+_USER_FIELDS: tuple[tuple[str, str, str | None], ...] = (
+    ("ID", "id", None),
+    ("Membership", "membership", "Free"),
+    ("Email", "email", None),
+)
+
 
 def register_user_tools(server: FastMCP, client: WorldAnvilClient) -> None:
     """Register user-related MCP tools.
@@ -24,9 +32,15 @@ def register_user_tools(server: FastMCP, client: WorldAnvilClient) -> None:
     - get_identity: Retrieve basic user identity
     - get_current_user: Retrieve full user profile
 
+    The tools keep a reference to ``client`` and send every request through
+    it, so it must be created once per process and stay open (inside its
+    ``async with`` block) for as long as the server runs. Its pooled HTTP/2
+    connections are what spare each tool call a new TCP/TLS handshake; do
+    not create a client per request.
+
     Args:
         server: MCP server instance to register tools with
-        client: Initialized WorldAnvilClient for API requests
+        client: Initialized WorldAnvilClient for API requests, shared by all tools
 
     Example:
         >>> from mcp.server import Server
@@ -37,7 +51,7 @@ def register_user_tools(server: FastMCP, client: WorldAnvilClient) -> None:
     """
 
     @server.tool()
-    async def get_identity() -> list[TextContent]:
+    async def get_identity() -> tuple[TextContent, ...]:
         """Get the current authenticated user's identity.
 
         Retrieves basic identity information (id and username) to verify
@@ -59,15 +73,15 @@ def register_user_tools(server: FastMCP, client: WorldAnvilClient) -> None:
         data = await client.get_identity()
         identity = Identity.model_validate(data)
 
-        return [
+        return (
             TextContent(
                 type="text",
                 text=(f"Authenticated as: {identity.username} (ID: {identity.id})"),
-            )
-        ]
+            ),
+        )
 
     @server.tool()
-    async def get_current_user(granularity: int = 1) -> list[TextContent]:
+    async def get_current_user(granularity: int = 1) -> tuple[TextContent, ...]:
         """Get full profile details for the current authenticated user.
 
         Retrieves detailed user information including profile metadata,
@@ -99,17 +113,12 @@ def register_user_tools(server: FastMCP, client: WorldAnvilClient) -> None:
         data = await client.get_current_user(granularity=granularity)
         user = User.model_validate(data)
 
-        # Build formatted text output
-        lines = [f"# User: {user.username}", f"- ID: {user.id}"]
-
-        # Add membership, defaulting to "Free" if not present
-        membership = user.membership or "Free"
-        lines.append(f"- Membership: {membership}")
-
-        # Add email if present
-        if user.email:
-            lines.append(f"- Email: {user.email}")
-
+        lines = [f"# User: {user.username}"]
+        lines.extend(
+            f"- {label}: {value}"
+            for label, attr, default in _USER_FIELDS
+            if (value := getattr(user, attr) or default)
+        )
         text_output = "\n".join(lines)
 
-        return [TextContent(type="text", text=text_output)]
+        return (TextContent(type="text", text=text_output),)
@@ -4,11 +4,29 @@ from __future__ import annotations
 
 from mcp.server.fastmcp import FastMCP
 from mcp.types import TextContent
+from pydantic import TypeAdapter
 
 from ..client import WorldAnvilClient
 from ..ecosystem.detector import EcosystemDetector
 from ..models.world import World, WorldSummary
 
+# Validates a whole list response in one call instead of one call per world
+_WORLDS_ADAPTER = TypeAdapter(list[WorldSummary])
+
+# Fixed tool responses. FastMCP accepts any list or tuple of content blocks,
+# so these prebuilt one-element tuples are returned as is.
+NO_WORLDS_MESSAGE = "No worlds found. Create a world at worldanvil.com first."
+NO_UPDATES_MESSAGE = "No updates specified. Provide name, description, or genre to update."
+_NO_WORLDS = (TextContent(type="text", text=NO_WORLDS_MESSAGE),)
+_NO_UPDATES = (TextContent(type="text", text=NO_UPDATES_MESSAGE),)
+
+# get_world markdown skeleton; the optional sections are rendered (or left
+# empty) by the caller and slotted into {description} and {rpg_system}.
+_render_world = (
+    "# {name}\n\n**ID**: `{id}`\n**Genre**: {genre}{description}"
+    "\n\n## Content\n\n- **Articles**: {articles}\n- **Categories**: {categories}{rpg_system}"
+).format_map
+
 
 def register_world_tools(
     server: FastMCP,
@@ -17,17 +35,24 @@ def register_world_tools(
 ) -> None:
     """Register world-related MCP tools.
 
+    As with register_user_tools, ``client`` must be one long-lived instance,
+    open for as long as the server runs, not one created per request.
+
     Args:
         server: The MCP server instance.
-        client: The WorldAnvilClient for API calls.
+        client: The WorldAnvilClient for API calls, shared by all tools.
         ecosystem: The EcosystemDetector for integration hints.
 
     Example:
         >>> register_world_tools(server, client, ecosystem)
     """
+    # Detection is fixed once the detector is built, so the ecosystem hint
+    # appended to list_worlds is formatted once here rather than per call
+    integration_hint = ecosystem.get_ecosystem_status()
+    hint_suffix = f"\n\n---\n\n{integration_hint}" if integration_hint else ""
 
     @server.tool()
-    async def list_worlds(granularity: int = 1) -> list[TextContent]:
+    async def list_worlds(granularity: int = 1) -> tuple[TextContent, ...]:
         """List all worlds accessible to the user.
 
         Args:
@@ -43,33 +68,22 @@ def register_world_tools(
         worlds_data = await client.list_worlds(granularity=granularity)
 
         if not worlds_data:
-            return [
-                TextContent(
-                    type="text", text=("No worlds found. Create a world at worldanvil.com first.")
-                )
-            ]
-
-        lines = ["# Your Worlds", ""]
-
-        for world_data in worlds_data:
-            world = WorldSummary.model_validate(world_data)
-            lines.append(f"- **{world.name}** (ID: `{world.id}`)")
-
-        lines.append("")
-        lines.append(f"*Total: {len(worlds_data)} worlds*")
+            return _NO_WORLDS
 
-        # Add ecosystem integration hints
-        integration_hint = ecosystem.get_ecosystem_status()
-        if integration_hint:
-            lines.extend(["", "---", "", integration_hint])
+        # One join over a generator rather than an append per world
+        body = "\n".join(
+            f"- **{world.name}** (ID: `{world.id}`)"
+            for world in _WORLDS_ADAPTER.validate_python(worlds_data)
+        )
+        text = f"# Your Worlds\n\n{body}\n\n*Total: {len(worlds_data)} worlds*{hint_suffix}"
 
-        return [TextContent(type="text", text="\n".join(lines))]
+        return (TextContent(type="text", text=text),)
 
     @server.tool()
     async def get_world(
         world_id: str,
         granularity: int = 1,
-    ) -> list[TextContent]:
+    ) -> tuple[TextContent, ...]:
         """Retrieve a specific world by ID.
 
         Args:
@@ -87,26 +101,21 @@ def register_world_tools(
         world_data = await client.get_world(world_id, granularity=granularity)
         world = World.model_validate(world_data)
 
-        lines = [f"# {world.name}", ""]
-        lines.append(f"**ID**: `{world.id}`")
-
-        if world.genre:
-            lines.append(f"**Genre**: {world.genre}")
-        else:
-            lines.append("**Genre**: Not set")
-
-        if world.description:
-            lines.extend(["", "## Description", "", world.description])
-
-        # Content section
-        lines.extend(["", "## Content", ""])
-        lines.append(f"- **Articles**: {world.article_count or 0}")
-        lines.append(f"- **Categories**: {world.category_count or 0}")
-
-        if hasattr(world, "rpg_system") and world.rpg_system:
-            lines.append(f"- **RPG System**: {world.rpg_system}")
-
-        return [TextContent(type="text", text="\n".join(lines))]
+        text = _render_world(
+            {
+                "name": world.name,
+                "id": world.id,
+                "genre": world.genre or "Not set",
+                "description": (
+                    f"\n\n## Description\n\n{world.description}" if world.description else ""
+                ),
+                "articles": world.article_count or 0,
+                "categories": world.category_count or 0,
+                "rpg_system": f"\n- **RPG System**: {world.rpg_system}" if world.rpg_system else "",
+            }
+        )
+
+        return (TextContent(type="text", text=text),)
 
     @server.tool()
     async def update_world(
@@ -114,7 +123,7 @@ def register_world_tools(
         name: str | None = None,
         description: str | None = None,
         genre: str | None = None,
-    ) -> list[TextContent]:
+    ) -> tuple[TextContent, ...]:
         """Update a world's properties.
 
         Args:
@@ -132,28 +141,27 @@ def register_world_tools(
             ValidationError: Invalid parameters.
             RateLimitError: Rate limit exceeded.
         """
-        updates = {}
-        if name is not None:
-            updates["name"] = name
-        if description is not None:
-            updates["description"] = description
-        if genre is not None:
-            updates["genre"] = genre
+        updates = {
+            field: value
+            for field, value in (("name", name), ("description", description), ("genre", genre))
+            if value is not None
+        }
 
         if not updates:
-            return [
-                TextContent(
-                    type="text",
-                    text=("No updates specified. Provide name, description, or genre to update."),
-                )
-            ]
+            return _NO_UPDATES
 
         world_data = await client.update_world(world_id, **updates)
-        world = World.model_validate(world_data)
 
-        return [
+        # Only the name and id are echoed back, so the full World model is not
+        # built; fall back to the request values if the response omits them or
+        # returns null, and leave the name out if neither side has one.
+        updated_name = world_data.get("name") or name
+        updated_id = world_data.get("id") or world_id
+        label = f"**{updated_name}** (`{updated_id}`)" if updated_name else f"`{updated_id}`"
+
+        return (
             TextContent(
                 type="text",
-                text=f"✅ Updated world: **{world.name}** (`{world.id}`)",
-            )
-        ]
+                text=f"✅ Updated world: {label}",
+            ),
+        )
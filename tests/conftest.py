@@ -2,6 +2,10 @@
 
 This module provides common fixtures used across all test modules, including
 mock client configurations, sample data generators, and test utilities.
+
+The Faker instance, client configuration and sample data are session-scoped
+and shared between tests; tests that need to modify them should work on a
+``copy.deepcopy`` instead.
 """
 
 import os
@@ -11,7 +15,7 @@ import pytest
 from faker import Faker
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def faker_seed() -> int:
     """Provide deterministic seed for Faker.
 
@@ -21,10 +25,12 @@ def faker_seed() -> int:
     return 12345
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def faker(faker_seed: int) -> Faker:
     """Provide Faker instance with deterministic seed.
 
+    Created and seeded once per session rather than reseeded for every test.
+
     Args:
         faker_seed: Seed for reproducible data generation.
 
@@ -36,10 +42,12 @@ def faker(faker_seed: int) -> Faker:
     return fake
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_client_config() -> dict[str, str]:
     """Provide test configuration for WorldAnvilClient.
 
+    Session-scoped so module-scoped client fixtures can use it; do not mutate.
+
     Returns:
         dict: Configuration dict with test credentials and base URL.
     """
@@ -50,7 +58,7 @@ def mock_client_config() -> dict[str, str]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_user_data(faker: Faker) -> dict:
     """Generate sample user JSON response.
 
@@ -69,7 +77,7 @@ def sample_user_data(faker: Faker) -> dict:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_world_data(faker: Faker) -> dict:
     """Generate sample world JSON response.
 
@@ -89,7 +97,7 @@ def sample_world_data(faker: Faker) -> dict:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_article_data(faker: Faker) -> dict:
     """Generate sample article JSON response.
 
@@ -112,7 +120,7 @@ def sample_article_data(faker: Faker) -> dict:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_category_data(faker: Faker) -> dict:
     """Generate sample category JSON response.
 
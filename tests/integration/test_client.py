@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import AsyncGenerator
 
 import httpx
@@ -21,9 +22,11 @@ from world_anvil_mcp.exceptions import (
 BASE_URL = "https://www.worldanvil.com/api/external/boromir"
 
 
-@pytest_asyncio.fixture
-async def client(mock_client_config: dict[str, str]) -> AsyncGenerator[WorldAnvilClient, None]:
-    """Provide an initialized client for tests."""
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def shared_client(
+    mock_client_config: dict[str, str],
+) -> AsyncGenerator[WorldAnvilClient, None]:
+    """Provide one initialized client for the whole module."""
     async with WorldAnvilClient(
         app_key=mock_client_config["app_key"],
         user_token=mock_client_config["user_token"],
@@ -32,8 +35,15 @@ async def client(mock_client_config: dict[str, str]) -> AsyncGenerator[WorldAnvi
         yield client
 
 
+@pytest.fixture
+def client(shared_client: WorldAnvilClient) -> WorldAnvilClient:
+    """Provide the shared client with an empty cache, as if freshly created."""
+    shared_client._cache.clear()
+    return shared_client
+
+
 @pytest.mark.integration
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 @respx.mock(base_url=BASE_URL)
 async def test_get_identity_uses_cache(
     respx_mock: respx.MockRouter,
@@ -53,7 +63,109 @@ async def test_get_identity_uses_cache(
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
+@respx.mock(base_url=BASE_URL)
+async def test_cached_response_not_shared_between_callers(
+    respx_mock: respx.MockRouter,
+    client: WorldAnvilClient,
+) -> None:
+    """Mutating a returned response must not change later cache hits."""
+    respx_mock.get("/identity").mock(
+        return_value=Response(200, json={"id": "user-1", "username": "tester"}),
+    )
+
+    first = await client.get_identity()
+    first["username"] = "mutated"
+    second = await client.get_identity()
+
+    assert second["username"] == "tester"
+    assert respx_mock.calls.call_count == 1
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio(loop_scope="module")
+@respx.mock(base_url=BASE_URL)
+async def test_concurrent_identical_gets_share_one_request(
+    respx_mock: respx.MockRouter,
+    client: WorldAnvilClient,
+) -> None:
+    """Concurrent cache misses for the same key should send one HTTP call."""
+    respx_mock.get("/world/world-1").mock(
+        return_value=Response(200, json={"id": "world-1", "name": "Alpha"}),
+    )
+
+    first, second = await asyncio.gather(
+        client.get_world("world-1"),
+        client.get_world("world-1"),
+    )
+
+    assert first == second == {"id": "world-1", "name": "Alpha"}
+    assert first is not second
+    assert respx_mock.calls.call_count == 1
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio(loop_scope="module")
+@respx.mock(base_url=BASE_URL)
+async def test_oversized_response_rejected(
+    respx_mock: respx.MockRouter,
+    mock_client_config: dict[str, str],
+) -> None:
+    """Bodies over max_response_bytes should raise instead of being parsed."""
+    respx_mock.get("/identity").mock(
+        return_value=Response(200, json={"id": "user-1", "username": "x" * 100}),
+    )
+
+    async with WorldAnvilClient(
+        app_key=mock_client_config["app_key"],
+        user_token=mock_client_config["user_token"],
+        base_url=mock_client_config["base_url"],
+        max_response_bytes=64,
+    ) as small_client:
+        with pytest.raises(WorldAnvilAPIError, match="exceeds 64 bytes"):
+            await small_client.get_identity()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio(loop_scope="module")
+@respx.mock(base_url=BASE_URL)
+async def test_understated_content_length_still_bounded(
+    respx_mock: respx.MockRouter,
+    mock_client_config: dict[str, str],
+) -> None:
+    """A Content-Length under the limit should not let a larger body through."""
+    respx_mock.get("/identity").mock(
+        return_value=Response(200, content=b"x" * 100, headers={"Content-Length": "10"}),
+    )
+
+    async with WorldAnvilClient(
+        app_key=mock_client_config["app_key"],
+        user_token=mock_client_config["user_token"],
+        base_url=mock_client_config["base_url"],
+        max_response_bytes=64,
+    ) as small_client:
+        with pytest.raises(WorldAnvilAPIError, match="exceeds 64 bytes"):
+            await small_client.get_identity()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio(loop_scope="module")
+@respx.mock(base_url=BASE_URL)
+async def test_malformed_content_length_rejected(
+    respx_mock: respx.MockRouter,
+    client: WorldAnvilClient,
+) -> None:
+    """A non-numeric Content-Length should raise WorldAnvilAPIError."""
+    respx_mock.get("/identity").mock(
+        return_value=Response(200, content=b"{}", headers={"Content-Length": "abc"}),
+    )
+
+    with pytest.raises(WorldAnvilAPIError, match="Malformed Content-Length"):
+        await client.get_identity()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio(loop_scope="module")
 @respx.mock(base_url=BASE_URL)
 async def test_get_identity_auth_error(
     respx_mock: respx.MockRouter,
@@ -67,7 +179,7 @@ async def test_get_identity_auth_error(
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 @respx.mock(base_url=BASE_URL)
 async def test_success_false_raises_api_error(
     respx_mock: respx.MockRouter,
@@ -83,7 +195,7 @@ async def test_success_false_raises_api_error(
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 @respx.mock(base_url=BASE_URL)
 async def test_list_worlds_uses_string_granularity(
     respx_mock: respx.MockRouter, client: WorldAnvilClient
@@ -100,7 +212,7 @@ async def test_list_worlds_uses_string_granularity(
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 @respx.mock(base_url=BASE_URL)
 async def test_update_world_invalidates_cache(
     respx_mock: respx.MockRouter,
@@ -151,7 +263,7 @@ async def test_update_world_invalidates_cache(
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 @respx.mock(base_url=BASE_URL)
 async def test_rate_limit_error_exposes_retry_after(
     respx_mock: respx.MockRouter, client: WorldAnvilClient
@@ -168,7 +280,7 @@ async def test_rate_limit_error_exposes_retry_after(
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 @respx.mock(base_url=BASE_URL)
 async def test_get_world_not_found_raises(
     respx_mock: respx.MockRouter,
@@ -182,7 +294,43 @@ async def test_get_world_not_found_raises(
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
+@respx.mock(base_url=BASE_URL)
+async def test_get_world_not_found_is_cached(
+    respx_mock: respx.MockRouter,
+    client: WorldAnvilClient,
+) -> None:
+    """Repeated lookups of a missing world should not repeat the request."""
+    respx_mock.get("/world/missing").mock(return_value=Response(404))
+
+    for _ in range(2):
+        with pytest.raises(WorldAnvilNotFoundError):
+            await client.get_world("missing")
+
+    assert respx_mock.calls.call_count == 1
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio(loop_scope="module")
+@respx.mock(base_url=BASE_URL)
+async def test_higher_granularity_cache_serves_lower_granularity(
+    respx_mock: respx.MockRouter,
+    client: WorldAnvilClient,
+) -> None:
+    """A cached detailed world should answer a less detailed lookup."""
+    respx_mock.get("/world/world-1").mock(
+        return_value=Response(200, json={"id": "world-1", "name": "Alpha"}),
+    )
+
+    await client.get_world("world-1", granularity=2)
+    result = await client.get_world("world-1", granularity=1)
+
+    assert result == {"id": "world-1", "name": "Alpha"}
+    assert respx_mock.calls.call_count == 1
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio(loop_scope="module")
 @respx.mock(base_url=BASE_URL)
 async def test_server_error_raises_api_error(
     respx_mock: respx.MockRouter,
@@ -196,7 +344,7 @@ async def test_server_error_raises_api_error(
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 @respx.mock(base_url=BASE_URL)
 async def test_timeout_exhausts_retries(
     respx_mock: respx.MockRouter,
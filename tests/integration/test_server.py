@@ -3,21 +3,31 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Generator
 
 import pytest
 
 from world_anvil_mcp import server
 
 
+@pytest.fixture(autouse=True)
+def fresh_env_snapshot() -> Generator[None, None, None]:
+    """Make each test read the environment it patched, not a cached snapshot."""
+    # Load any .env now, as the import used to, so it cannot undo a test's patches
+    server._ensure_dotenv_loaded()
+    server._reset_env_cache()
+    yield
+    server._reset_env_cache()
+
+
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_get_api_status_ready(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_get_api_status_ready(monkeypatch: pytest.MonkeyPatch) -> None:
     """Status tool reports ready when credentials are present."""
     monkeypatch.setenv("WORLD_ANVIL_APP_KEY", "app-key")
     monkeypatch.setenv("WORLD_ANVIL_USER_TOKEN", "user-token")
     monkeypatch.setenv("WORLD_ANVIL_API_BASE", "https://api.test")
 
-    status = await server.get_api_status()
+    status = server.get_api_status()
 
     assert status["status"] == "ready"
     assert status["api_base"] == "https://api.test"
@@ -26,13 +36,12 @@ async def test_get_api_status_ready(monkeypatch: pytest.MonkeyPatch) -> None:
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_get_api_status_not_configured(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_get_api_status_not_configured(monkeypatch: pytest.MonkeyPatch) -> None:
     """Status tool reports not_configured when credentials are missing."""
     monkeypatch.delenv("WORLD_ANVIL_APP_KEY", raising=False)
     monkeypatch.delenv("WORLD_ANVIL_USER_TOKEN", raising=False)
 
-    status = await server.get_api_status()
+    status = server.get_api_status()
 
     assert status["status"] == "not_configured"
     assert status["has_app_key"] is False
@@ -53,6 +62,21 @@ def test_config_resource_json(monkeypatch: pytest.MonkeyPatch) -> None:
     assert data["api_base"] == "https://www.worldanvil.com/api/external/boromir"
 
 
+@pytest.mark.integration
+def test_config_resource_cached_per_snapshot(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Configuration JSON is reused until the environment snapshot changes."""
+    monkeypatch.delenv("WORLD_ANVIL_APP_KEY", raising=False)
+    first = server.get_config_status()
+
+    assert server.get_config_status() is first
+
+    monkeypatch.setenv("WORLD_ANVIL_APP_KEY", "app-key")
+    monkeypatch.setenv("WORLD_ANVIL_USER_TOKEN", "user-token")
+    server._env_snapshot.cache_clear()
+
+    assert json.loads(server.get_config_status())["configured"] is True
+
+
 @pytest.mark.integration
 def test_main_warns_and_runs(
     monkeypatch: pytest.MonkeyPatch,
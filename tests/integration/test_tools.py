@@ -2,28 +2,34 @@
 
 from __future__ import annotations
 
-from typing import cast
+from collections.abc import Iterable
 from unittest.mock import AsyncMock
 
 import pytest
 from mcp.server.fastmcp import FastMCP
 from mcp.types import TextContent
 
+from world_anvil_mcp.client import WorldAnvilClient
 from world_anvil_mcp.ecosystem.detector import EcosystemDetector
 from world_anvil_mcp.tools.user import register_user_tools
 from world_anvil_mcp.tools.world import register_world_tools
 
 
+def _first_text(contents: Iterable[object]) -> str:
+    """Return the text of the first content block a tool produced."""
+    first = next(iter(contents), None)
+    assert isinstance(first, TextContent)
+    return first.text
+
+
 @pytest.fixture
 def server() -> FastMCP:
-    """Provide a fresh MCP server for tool registration."""
+    """Provide a fresh MCP server, for tests that register tools themselves."""
     return FastMCP("test-server")
 
 
-@pytest.fixture
-def mock_client() -> AsyncMock:
-    """Provide an async mock client with default responses."""
-    client = AsyncMock()
+def _install_defaults(client: AsyncMock) -> None:
+    """Set the default client responses the tests start from."""
     client.get_identity.return_value = {"id": "u1", "username": "tester"}
     client.get_current_user.return_value = {
         "id": "u1",
@@ -44,70 +50,83 @@ def mock_client() -> AsyncMock:
         "article_count": 1,
         "category_count": 0,
     }
+
+
+@pytest.fixture(scope="module")
+def mock_client() -> AsyncMock:
+    """Provide one async mock client for the module, limited to the real client's API."""
+    client = AsyncMock(spec=WorldAnvilClient)
+    _install_defaults(client)
     return client
 
 
+@pytest.fixture(scope="module")
+def empty_ecosystem() -> EcosystemDetector:
+    """Provide a detector with no companion MCPs, shared by the module."""
+    return EcosystemDetector([])
+
+
+@pytest.fixture(scope="module")
+def registered_server(mock_client: AsyncMock, empty_ecosystem: EcosystemDetector) -> FastMCP:
+    """Provide a server with the user and world tools registered once for the module."""
+    server = FastMCP("test-server")
+    register_user_tools(server, mock_client)
+    register_world_tools(server, mock_client, empty_ecosystem)
+    return server
+
+
+@pytest.fixture(autouse=True)
+def default_responses(mock_client: AsyncMock) -> None:
+    """Give each test a mock client with no recorded calls and default responses."""
+    mock_client.reset_mock(return_value=True, side_effect=True)
+    _install_defaults(mock_client)
+
+
 @pytest.mark.integration
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_registers_user_tools_and_outputs_text(
-    server: FastMCP,
+    registered_server: FastMCP,
     mock_client: AsyncMock,
 ) -> None:
     """User tools should register and call through to the client."""
-    register_user_tools(server, mock_client)
-
-    tools = await server.list_tools()
+    tools = await registered_server.list_tools()
     tool_names = {tool.name for tool in tools}
     assert {"get_identity", "get_current_user"}.issubset(tool_names)
 
-    contents, _ = await server.call_tool("get_identity", {})
-    assert contents
-    contents_list = cast(list[TextContent], list(contents))
-    first = contents_list[0]
-    assert isinstance(first, TextContent)
-    assert "Authenticated as" in first.text
+    contents, _ = await registered_server.call_tool("get_identity", {})
+    text = _first_text(contents)
+    assert "Authenticated as" in text
     mock_client.get_identity.assert_awaited()
 
-    contents, _ = await server.call_tool("get_current_user", {"granularity": 2})
-    assert contents
-    contents_list = cast(list[TextContent], list(contents))
-    first = contents_list[0]
-    assert isinstance(first, TextContent)
-    assert "Membership" in first.text
+    contents, _ = await registered_server.call_tool("get_current_user", {"granularity": 2})
+    text = _first_text(contents)
+    assert "Membership" in text
     mock_client.get_current_user.assert_awaited_with(granularity=2)
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_list_worlds_handles_empty_state(server: FastMCP, mock_client: AsyncMock) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_list_worlds_handles_empty_state(
+    registered_server: FastMCP, mock_client: AsyncMock
+) -> None:
     """World list tool should respond gracefully with no worlds."""
-    ecosystem = EcosystemDetector([])
-    register_world_tools(server, mock_client, ecosystem)
+    contents, _ = await registered_server.call_tool("list_worlds", {"granularity": 1})
 
-    contents, _ = await server.call_tool("list_worlds", {"granularity": 1})
-
-    assert contents
-    contents_list = cast(list[TextContent], list(contents))
-    first = contents_list[0]
-    assert isinstance(first, TextContent)
-    assert "No worlds found" in first.text
+    text = _first_text(contents)
+    assert "No worlds found" in text
     mock_client.list_worlds.assert_awaited_with(granularity=1)
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_update_world_tool_validates_inputs(server: FastMCP, mock_client: AsyncMock) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_update_world_tool_validates_inputs(
+    registered_server: FastMCP, mock_client: AsyncMock
+) -> None:
     """Update world tool should enforce required updates and call client when provided."""
-    ecosystem = EcosystemDetector([])
-    register_world_tools(server, mock_client, ecosystem)
-
     # No updates provided
-    contents, _ = await server.call_tool("update_world", {"world_id": "w1"})
-    assert contents
-    contents_list = cast(list[TextContent], list(contents))
-    first = contents_list[0]
-    assert isinstance(first, TextContent)
-    assert "No updates specified" in first.text
+    contents, _ = await registered_server.call_tool("update_world", {"world_id": "w1"})
+    text = _first_text(contents)
+    assert "No updates specified" in text
     mock_client.update_world.assert_not_awaited()
 
     # Provide a name update
@@ -118,20 +137,45 @@ async def test_update_world_tool_validates_inputs(server: FastMCP, mock_client:
         "article_count": 1,
         "category_count": 0,
     }
-    contents, _ = await server.call_tool("update_world", {"world_id": "w1", "name": "Renamed"})
-    assert contents
-    contents_list = cast(list[TextContent], list(contents))
-    first = contents_list[0]
-    assert isinstance(first, TextContent)
-    assert "Renamed" in first.text
+    contents, _ = await registered_server.call_tool(
+        "update_world", {"world_id": "w1", "name": "Renamed"}
+    )
+    text = _first_text(contents)
+    assert "Renamed" in text
     mock_client.update_world.assert_awaited_with("w1", name="Renamed")
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_get_world_formats_details(server: FastMCP, mock_client: AsyncMock) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_update_world_handles_null_or_missing_name(
+    registered_server: FastMCP, mock_client: AsyncMock
+) -> None:
+    """Update world tool should never render a null name from the response."""
+    # Null name in the response falls back to the requested name
+    mock_client.update_world.return_value = {"id": "w1", "name": None}
+    contents, _ = await registered_server.call_tool(
+        "update_world", {"world_id": "w1", "name": "Renamed"}
+    )
+    text = _first_text(contents)
+    assert "**Renamed** (`w1`)" in text
+    assert "None" not in text
+
+    # No name anywhere: only the id is shown
+    mock_client.update_world.return_value = {"id": "w1"}
+    contents, _ = await registered_server.call_tool(
+        "update_world", {"world_id": "w1", "genre": "Horror"}
+    )
+    text = _first_text(contents)
+    assert "✅ Updated world: `w1`" in text
+    assert "None" not in text
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio(loop_scope="module")
+async def test_get_world_formats_details(
+    registered_server: FastMCP, mock_client: AsyncMock
+) -> None:
     """get_world tool should format world metadata and counts."""
-    ecosystem = EcosystemDetector([])
     mock_client.get_world.return_value = {
         "id": "w1",
         "name": "World One",
@@ -141,15 +185,11 @@ async def test_get_world_formats_details(server: FastMCP, mock_client: AsyncMock
         "category_count": 2,
         "rpg_system": "5e",
     }
-    register_world_tools(server, mock_client, ecosystem)
-
-    contents, _ = await server.call_tool("get_world", {"world_id": "w1", "granularity": 2})
+    contents, _ = await registered_server.call_tool(
+        "get_world", {"world_id": "w1", "granularity": 2}
+    )
 
-    assert contents
-    contents_list = cast(list[TextContent], list(contents))
-    first = contents_list[0]
-    assert isinstance(first, TextContent)
-    text = first.text
+    text = _first_text(contents)
     assert "World One" in text
     assert "Articles" in text
     assert "Sci-Fi" in text
@@ -157,7 +197,7 @@ async def test_get_world_formats_details(server: FastMCP, mock_client: AsyncMock
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_list_worlds_formats_and_adds_ecosystem_hint(
     server: FastMCP, mock_client: AsyncMock
 ) -> None:
@@ -171,11 +211,7 @@ async def test_list_worlds_formats_and_adds_ecosystem_hint(
 
     contents, _ = await server.call_tool("list_worlds", {"granularity": 1})
 
-    assert contents
-    contents_list = cast(list[TextContent], list(contents))
-    first = contents_list[0]
-    assert isinstance(first, TextContent)
-    text = first.text
+    text = _first_text(contents)
     assert "Alpha" in text
     assert "Beta" in text
     assert "*Total: 2 worlds*" in text
@@ -0,0 +1,61 @@
+"""Shared fixtures for model tests.
+
+This module provides World instances validated from realistic /world/{id}
+responses. Models are frozen, so one instance per session is shared by every
+test; tests that need a variation should use ``model_copy(update=...)``.
+"""
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
+import pytest
+
+from world_anvil_mcp.models.world import World
+
+_WORLD_GRAN1_RESPONSE: Mapping[str, Any] = MappingProxyType(
+    {
+        "id": "campaign_2024",
+        "name": "Rise of the Dark Lord",
+        "description": "An epic campaign of good vs evil",
+        "genre": "High Fantasy",
+        "locale": "en_US",
+        "article_count": 45,
+        "category_count": 7,
+        "created_at": "2023-01-20T14:00:00Z",
+        "updated_at": "2024-11-15T09:30:00Z",
+    }
+)
+
+# Granularity 2 adds the RPG system and the owner to the granularity 1 fields
+_WORLD_GRAN2_RESPONSE: Mapping[str, Any] = MappingProxyType(
+    {
+        **_WORLD_GRAN1_RESPONSE,
+        "rpg_system": "D&D 5e",
+        "owner": {
+            "id": "user_999",
+            "username": "campaign_master",
+            "email": "master@campaign.local",
+        },
+    }
+)
+
+
+@pytest.fixture(scope="session")
+def world_gran1() -> World:
+    """Provide a World validated from a granularity 1 /world/{id} response.
+
+    Returns:
+        World: World with description, counts and timestamps.
+    """
+    return World(**_WORLD_GRAN1_RESPONSE)
+
+
+@pytest.fixture(scope="session")
+def world_gran2() -> World:
+    """Provide a World validated from a granularity 2 /world/{id} response.
+
+    Returns:
+        World: World with every granularity 1 field plus RPG system and owner.
+    """
+    return World(**_WORLD_GRAN2_RESPONSE)
@@ -3,26 +3,30 @@
 Demonstrates model usage with typical World Anvil API response patterns.
 """
 
-from datetime import datetime
+from collections.abc import Mapping
+from datetime import UTC, datetime
+from types import MappingProxyType
+from typing import Any
+
+import pytest
 
 from world_anvil_mcp.models.user import Identity, User
 from world_anvil_mcp.models.world import World, WorldSummary
 
+# Expected values for the timestamp formats parsed below
+_JAN_15 = datetime.fromisoformat("2023-01-15T10:30:00")
+_JAN_15_UTC = _JAN_15.replace(tzinfo=UTC)
 
-def test_identity_from_api_response() -> None:
-    """Test Identity model with typical /identity endpoint response."""
-    api_response = {
+# Read-only API responses shared by the tests below
+_IDENTITY_RESPONSE: Mapping[str, Any] = MappingProxyType(
+    {
         "id": "12345",
         "username": "dungeon_master",
     }
-    identity = Identity(**api_response)
-    assert identity.id == "12345"
-    assert identity.username == "dungeon_master"
+)
 
-
-def test_user_from_api_response() -> None:
-    """Test User model with typical /user endpoint response."""
-    api_response = {
+_USER_RESPONSE: Mapping[str, Any] = MappingProxyType(
+    {
         "id": "12345",
         "username": "dungeon_master",
         "email": "dm@campaign.local",
@@ -30,70 +34,84 @@ def test_user_from_api_response() -> None:
         "membership": "master",
         "created_at": "2020-06-15T10:30:00Z",
     }
-    user = User(**api_response)
+)
+
+_WORLD_LIST_RESPONSE: tuple[Mapping[str, Any], ...] = (
+    MappingProxyType({"id": "world_1", "name": "The Forgotten Realms"}),
+    MappingProxyType({"id": "world_2", "name": "Mystara"}),
+    MappingProxyType({"id": "world_3", "name": "Eberron"}),
+)
+
+_WORLD_EXTRA_FIELDS_RESPONSE: Mapping[str, Any] = MappingProxyType(
+    {
+        "id": "custom_world",
+        "name": "Hidden Realm",
+        "description": "A secret world",
+        # Extra fields that might be added in future API versions
+        "thumbnail_url": "https://example.com/thumb.jpg",
+        "featured": True,
+        "visibility": "private",
+        "tags": ["homebrew", "experimental"],
+    }
+)
+
+_WORLD_NULL_FIELDS_RESPONSE: Mapping[str, Any] = MappingProxyType(
+    {
+        "id": "minimal_world",
+        "name": "Minimal World",
+        "description": None,
+        "genre": None,
+        "locale": None,
+        "article_count": None,
+        "category_count": None,
+        "rpg_system": None,
+        "created_at": None,
+        "updated_at": None,
+        "owner": None,
+    }
+)
+
+
+def test_identity_from_api_response() -> None:
+    """Test Identity model with typical /identity endpoint response."""
+    identity = Identity(**_IDENTITY_RESPONSE)
+    assert identity.id == "12345"
+    assert identity.username == "dungeon_master"
+
+
+def test_user_from_api_response() -> None:
+    """Test User model with typical /user endpoint response."""
+    user = User(**_USER_RESPONSE)
     assert user.id == "12345"
     assert user.username == "dungeon_master"
     assert user.email == "dm@campaign.local"
     assert user.membership == "master"
-    assert isinstance(user.created_at, datetime)
+    assert user.created_at == datetime(2020, 6, 15, 10, 30, tzinfo=UTC)
 
 
 def test_world_summary_from_list_response() -> None:
     """Test WorldSummary with response from /user/worlds (granularity 0)."""
-    api_responses = [
-        {"id": "world_1", "name": "The Forgotten Realms"},
-        {"id": "world_2", "name": "Mystara"},
-        {"id": "world_3", "name": "Eberron"},
-    ]
-    worlds = [WorldSummary(**response) for response in api_responses]
+    worlds = [WorldSummary(**response) for response in _WORLD_LIST_RESPONSE]
     assert len(worlds) == 3
     assert worlds[0].name == "The Forgotten Realms"
     assert worlds[1].name == "Mystara"
     assert worlds[2].name == "Eberron"
 
 
-def test_world_from_get_response_granularity_1() -> None:
+def test_world_from_get_response_granularity_1(world_gran1: World) -> None:
     """Test World model with /world/{id} response (granularity 1)."""
-    api_response = {
-        "id": "campaign_2024",
-        "name": "Rise of the Dark Lord",
-        "description": "An epic campaign of good vs evil",
-        "genre": "High Fantasy",
-        "locale": "en_US",
-        "article_count": 45,
-        "category_count": 7,
-        "created_at": "2023-01-20T14:00:00Z",
-        "updated_at": "2024-11-15T09:30:00Z",
-    }
-    world = World(**api_response)
+    world = world_gran1
     assert world.id == "campaign_2024"
     assert world.name == "Rise of the Dark Lord"
     assert world.article_count == 45
     assert world.category_count == 7
-    assert isinstance(world.created_at, datetime)
-    assert isinstance(world.updated_at, datetime)
+    assert world.created_at == datetime(2023, 1, 20, 14, 0, tzinfo=UTC)
+    assert world.updated_at == datetime(2024, 11, 15, 9, 30, tzinfo=UTC)
 
 
-def test_world_from_get_response_granularity_2() -> None:
+def test_world_from_get_response_granularity_2(world_gran2: World) -> None:
     """Test World model with /world/{id} response (granularity 2) including owner."""
-    api_response = {
-        "id": "campaign_2024",
-        "name": "Rise of the Dark Lord",
-        "description": "An epic campaign of good vs evil",
-        "genre": "High Fantasy",
-        "locale": "en_US",
-        "article_count": 45,
-        "category_count": 7,
-        "rpg_system": "D&D 5e",
-        "created_at": "2023-01-20T14:00:00Z",
-        "updated_at": "2024-11-15T09:30:00Z",
-        "owner": {
-            "id": "user_999",
-            "username": "campaign_master",
-            "email": "master@campaign.local",
-        },
-    }
-    world = World(**api_response)
+    world = world_gran2
     assert world.owner is not None
     assert world.owner["username"] == "campaign_master"
     assert world.rpg_system == "D&D 5e"
@@ -101,17 +119,7 @@ def test_world_from_get_response_granularity_2() -> None:
 
 def test_world_with_extra_api_fields() -> None:
     """Test World handles extra API fields gracefully."""
-    api_response = {
-        "id": "custom_world",
-        "name": "Hidden Realm",
-        "description": "A secret world",
-        # Extra fields that might be added in future API versions
-        "thumbnail_url": "https://example.com/thumb.jpg",
-        "featured": True,
-        "visibility": "private",
-        "tags": ["homebrew", "experimental"],
-    }
-    world = World(**api_response)
+    world = World(**_WORLD_EXTRA_FIELDS_RESPONSE)
     assert world.name == "Hidden Realm"
     # Extra fields are captured in model dump
     data = world.model_dump()
@@ -129,35 +137,23 @@ def test_world_summary_serialization_roundtrip() -> None:
     assert deserialized.name == original.name
 
 
-def test_user_datetime_parsing_various_formats() -> None:
+@pytest.mark.parametrize(
+    ("created_at_str", "expected"),
+    [
+        ("2023-01-15T10:30:00", _JAN_15),
+        ("2023-01-15T10:30:00Z", _JAN_15_UTC),
+        ("2023-01-15T10:30:00+00:00", _JAN_15_UTC),
+    ],
+)
+def test_user_datetime_parsing_various_formats(created_at_str: str, expected: datetime) -> None:
     """Test User parses various ISO 8601 datetime formats."""
-    test_cases = [
-        "2023-01-15T10:30:00",
-        "2023-01-15T10:30:00Z",
-        "2023-01-15T10:30:00+00:00",
-    ]
-    for created_at_str in test_cases:
-        user = User(id="test", username="user", created_at=created_at_str)
-        assert isinstance(user.created_at, datetime)
-        assert user.created_at.year == 2023
+    user = User(id="test", username="user", created_at=created_at_str)
+    assert user.created_at == expected
 
 
 def test_world_null_optional_fields() -> None:
     """Test World handles null values for optional fields."""
-    api_response = {
-        "id": "minimal_world",
-        "name": "Minimal World",
-        "description": None,
-        "genre": None,
-        "locale": None,
-        "article_count": None,
-        "category_count": None,
-        "rpg_system": None,
-        "created_at": None,
-        "updated_at": None,
-        "owner": None,
-    }
-    world = World(**api_response)
+    world = World(**_WORLD_NULL_FIELDS_RESPONSE)
     assert world.name == "Minimal World"
     assert world.description is None
     assert world.article_count is None
@@ -5,23 +5,89 @@ serialization, and flexibility for API evolution.
 """
 
 from datetime import datetime
+from typing import Any
 
 import pytest
 
 from world_anvil_mcp.models.user import Identity, User
 
+_CREATED = datetime.fromisoformat("2023-01-15T10:30:00")
+
+# (payload, expected field values) rows for TestIdentity.test_identity_fields
+_IDENTITY_CASES = [
+    pytest.param(
+        {"id": "user123", "username": "testuser"},
+        {"id": "user123", "username": "testuser"},
+        id="minimal",
+    ),
+    pytest.param(
+        {"id": "user456", "username": "anotheruser"},
+        {"id": "user456", "username": "anotheruser"},
+        id="other-user",
+    ),
+]
+
+# (payload, expected field values) rows for TestUser.test_user_fields
+_USER_CASES = [
+    pytest.param(
+        {"id": "user789", "username": "minimaluser"},
+        {
+            "id": "user789",
+            "username": "minimaluser",
+            "email": None,
+            "avatar": None,
+            "membership": None,
+            "created_at": None,
+        },
+        id="required-fields-only",
+    ),
+    pytest.param(
+        {
+            "id": "user123",
+            "username": "testuser",
+            "email": "test@example.com",
+            "avatar": "https://example.com/avatar.jpg",
+            "membership": "premium",
+            "created_at": _CREATED,
+        },
+        {
+            "id": "user123",
+            "username": "testuser",
+            "email": "test@example.com",
+            "avatar": "https://example.com/avatar.jpg",
+            "membership": "premium",
+            "created_at": _CREATED,
+        },
+        id="all-fields",
+    ),
+    pytest.param(
+        {
+            "id": "user456",
+            "username": "anotheruser",
+            "email": "another@example.com",
+            "created_at": _CREATED,
+        },
+        {
+            "id": "user456",
+            "username": "anotheruser",
+            "email": "another@example.com",
+            "created_at": _CREATED,
+        },
+        id="some-fields",
+    ),
+]
+
 
 class TestIdentity:
     """Tests for Identity model."""
 
-    def test_identity_minimal_valid(self) -> None:
-        """Test creating Identity with required fields only."""
-        identity = Identity(
-            id="user123",
-            username="testuser",
-        )
-        assert identity.id == "user123"
-        assert identity.username == "testuser"
+    @pytest.mark.parametrize(("payload", "expected"), _IDENTITY_CASES)
+    def test_identity_fields(self, payload: dict[str, Any], expected: dict[str, Any]) -> None:
+        """Test Identity stores and serializes the provided field values."""
+        identity = Identity(**payload)
+        data = identity.model_dump()
+        assert {field: getattr(identity, field) for field in expected} == expected
+        assert {field: data[field] for field in expected} == expected
 
     def test_identity_with_extra_fields(self) -> None:
         """Test Identity accepts extra fields for API flexibility."""
@@ -37,16 +103,6 @@ class TestIdentity:
         assert identity.model_dump().get("extra_field") == "extra_value"
         assert identity.model_dump().get("another_field") == 42
 
-    def test_identity_serialization(self) -> None:
-        """Test Identity serialization to dict and JSON."""
-        identity = Identity(
-            id="user456",
-            username="anotheruser",
-        )
-        data = identity.model_dump()
-        assert data["id"] == "user456"
-        assert data["username"] == "anotheruser"
-
     def test_identity_missing_required_field(self) -> None:
         """Test Identity validation fails without required field."""
         with pytest.raises(ValueError, match="Field required"):
@@ -67,36 +123,13 @@ class TestIdentity:
 class TestUser:
     """Tests for User model."""
 
-    def test_user_required_fields_only(self) -> None:
-        """Test creating User with only required fields."""
-        user = User(
-            id="user123",
-            username="testuser",
-        )
-        assert user.id == "user123"
-        assert user.username == "testuser"
-        assert user.email is None
-        assert user.avatar is None
-        assert user.membership is None
-        assert user.created_at is None
-
-    def test_user_with_all_fields(self) -> None:
-        """Test User with all optional fields provided."""
-        created = datetime.fromisoformat("2023-01-15T10:30:00")
-        user = User(
-            id="user123",
-            username="testuser",
-            email="test@example.com",
-            avatar="https://example.com/avatar.jpg",
-            membership="premium",
-            created_at=created,
-        )
-        assert user.id == "user123"
-        assert user.username == "testuser"
-        assert user.email == "test@example.com"
-        assert user.avatar == "https://example.com/avatar.jpg"
-        assert user.membership == "premium"
-        assert user.created_at == created
+    @pytest.mark.parametrize(("payload", "expected"), _USER_CASES)
+    def test_user_fields(self, payload: dict[str, Any], expected: dict[str, Any]) -> None:
+        """Test User stores and serializes the provided and default field values."""
+        user = User(**payload)
+        data = user.model_dump()
+        assert {field: getattr(user, field) for field in expected} == expected
+        assert {field: data[field] for field in expected} == expected
 
     def test_user_datetime_parsing(self) -> None:
         """Test User parses ISO 8601 datetime strings."""
@@ -105,10 +138,7 @@ class TestUser:
             username="testuser",
             created_at="2023-06-20T15:45:30",
         )
-        assert isinstance(user.created_at, datetime)
-        assert user.created_at.year == 2023
-        assert user.created_at.month == 6
-        assert user.created_at.day == 20
+        assert user.created_at == datetime.fromisoformat("2023-06-20T15:45:30")
 
     def test_user_with_extra_fields(self) -> None:
         """Test User accepts extra fields for API flexibility."""
@@ -123,35 +153,6 @@ class TestUser:
         assert data.get("custom_field") == "custom_value"
         assert data.get("metadata") == {"key": "value"}
 
-    def test_user_serialization(self) -> None:
-        """Test User serialization to dict."""
-        created = datetime.fromisoformat("2023-03-10T12:00:00")
-        user = User(
-            id="user456",
-            username="anotheruser",
-            email="another@example.com",
-            created_at=created,
-        )
-        data = user.model_dump()
-        assert data["id"] == "user456"
-        assert data["username"] == "anotheruser"
-        assert data["email"] == "another@example.com"
-        assert data["created_at"] == created
-
-    def test_user_serialization_with_none_values(self) -> None:
-        """Test User serialization includes None values."""
-        user = User(
-            id="user789",
-            username="minimaluser",
-        )
-        data = user.model_dump()
-        assert data["id"] == "user789"
-        assert data["username"] == "minimaluser"
-        assert data["email"] is None
-        assert data["avatar"] is None
-        assert data["membership"] is None
-        assert data["created_at"] is None
-
     def test_user_missing_required_field(self) -> None:
         """Test User validation fails without required field."""
         with pytest.raises(ValueError, match="Field required"):
@@ -5,11 +5,93 @@ levels, validation, and API flexibility.
 """
 
 from datetime import datetime
+from typing import Any
 
 import pytest
 
 from world_anvil_mcp.models.world import World, WorldSummary
 
+_CREATED = datetime.fromisoformat("2022-01-01T00:00:00")
+_UPDATED = datetime.fromisoformat("2023-12-15T10:30:00")
+_OWNER = {"id": "owner123", "username": "dmaster"}
+
+# (payload, expected field values) rows for TestWorld.test_world_fields
+_WORLD_CASES = [
+    pytest.param(
+        {"id": "world123", "name": "Epic Campaign"},
+        {
+            "id": "world123",
+            "name": "Epic Campaign",
+            "description": None,
+            "genre": None,
+            "article_count": None,
+        },
+        id="required-fields-only",
+    ),
+    pytest.param(
+        {
+            "id": "world456",
+            "name": "Grand Campaign",
+            "description": "A world of magic and mystery",
+            "genre": "Fantasy",
+            "locale": "en_US",
+            "article_count": 42,
+            "category_count": 8,
+            "rpg_system": "D&D 5e",
+            "created_at": _CREATED,
+            "updated_at": _UPDATED,
+            "owner": _OWNER,
+        },
+        {
+            "id": "world456",
+            "name": "Grand Campaign",
+            "description": "A world of magic and mystery",
+            "genre": "Fantasy",
+            "locale": "en_US",
+            "article_count": 42,
+            "category_count": 8,
+            "rpg_system": "D&D 5e",
+            "created_at": _CREATED,
+            "updated_at": _UPDATED,
+            "owner": _OWNER,
+        },
+        id="all-fields",
+    ),
+    pytest.param(
+        {
+            "id": "world999",
+            "name": "Article Count Test",
+            "article_count": 150,
+            "category_count": 25,
+        },
+        {"article_count": 150, "category_count": 25},
+        id="integer-counts",
+    ),
+    pytest.param(
+        {"id": "world000", "name": "Empty World", "article_count": 0, "category_count": 0},
+        {"article_count": 0, "category_count": 0},
+        id="zero-counts",
+    ),
+    pytest.param(
+        {
+            "id": "world444",
+            "name": "Partial World",
+            "description": "Only some fields",
+            "genre": "Horror",
+            "category_count": 5,
+            "rpg_system": "Call of Cthulhu",
+        },
+        {
+            "description": "Only some fields",
+            "genre": "Horror",
+            "category_count": 5,
+            "rpg_system": "Call of Cthulhu",
+            "article_count": None,
+        },
+        id="partial-fields",
+    ),
+]
+
 
 class TestWorldSummary:
     """Tests for WorldSummary model (granularity 0)."""
@@ -59,48 +141,13 @@ class TestWorldSummary:
 class TestWorld:
     """Tests for World model (granularity 1-2)."""
 
-    def test_world_required_fields_only(self) -> None:
-        """Test creating World with only required fields."""
-        world = World(
-            id="world123",
-            name="Epic Campaign",
-        )
-        assert world.id == "world123"
-        assert world.name == "Epic Campaign"
-        assert world.description is None
-        assert world.genre is None
-        assert world.article_count is None
-
-    def test_world_with_all_fields(self) -> None:
-        """Test World with all optional fields provided."""
-        created = datetime.fromisoformat("2022-01-01T00:00:00")
-        updated = datetime.fromisoformat("2023-12-15T10:30:00")
-        owner = {"id": "owner123", "username": "dmaster"}
-
-        world = World(
-            id="world456",
-            name="Grand Campaign",
-            description="A world of magic and mystery",
-            genre="Fantasy",
-            locale="en_US",
-            article_count=42,
-            category_count=8,
-            rpg_system="D&D 5e",
-            created_at=created,
-            updated_at=updated,
-            owner=owner,
-        )
-        assert world.id == "world456"
-        assert world.name == "Grand Campaign"
-        assert world.description == "A world of magic and mystery"
-        assert world.genre == "Fantasy"
-        assert world.locale == "en_US"
-        assert world.article_count == 42
-        assert world.category_count == 8
-        assert world.rpg_system == "D&D 5e"
-        assert world.created_at == created
-        assert world.updated_at == updated
-        assert world.owner == owner
+    @pytest.mark.parametrize(("payload", "expected"), _WORLD_CASES)
+    def test_world_fields(self, payload: dict[str, Any], expected: dict[str, Any]) -> None:
+        """Test World stores and serializes the provided and default field values."""
+        world = World(**payload)
+        data = world.model_dump()
+        assert {field: getattr(world, field) for field in expected} == expected
+        assert {field: data[field] for field in expected} == expected
 
     def test_world_datetime_parsing(self) -> None:
         """Test World parses ISO 8601 datetime strings."""
@@ -110,33 +157,8 @@ class TestWorld:
             created_at="2023-05-10T14:25:30",
             updated_at="2023-11-20T09:15:45",
         )
-        assert isinstance(world.created_at, datetime)
-        assert isinstance(world.updated_at, datetime)
-        assert world.created_at.year == 2023
-        assert world.created_at.month == 5
-        assert world.updated_at.month == 11
-
-    def test_world_integer_counts(self) -> None:
-        """Test World validates integer counts correctly."""
-        world = World(
-            id="world999",
-            name="Article Count Test",
-            article_count=150,
-            category_count=25,
-        )
-        assert world.article_count == 150
-        assert world.category_count == 25
-
-    def test_world_zero_counts(self) -> None:
-        """Test World accepts zero counts."""
-        world = World(
-            id="world000",
-            name="Empty World",
-            article_count=0,
-            category_count=0,
-        )
-        assert world.article_count == 0
-        assert world.category_count == 0
+        assert world.created_at == datetime.fromisoformat("2023-05-10T14:25:30")
+        assert world.updated_at == datetime.fromisoformat("2023-11-20T09:15:45")
 
     def test_world_with_extra_fields(self) -> None:
         """Test World accepts extra fields for API flexibility."""
@@ -164,48 +186,6 @@ class TestWorld:
         assert data["description"] is None
         assert data["article_count"] is None
 
-    def test_world_serialization_complete(self) -> None:
-        """Test World serialization with all fields."""
-        created = datetime.fromisoformat("2021-06-01T08:00:00")
-        owner = {"id": "dm1", "username": "GameMaster"}
-
-        world = World(
-            id="world333",
-            name="Complete World",
-            description="Full world data",
-            genre="Sci-Fi",
-            locale="en_GB",
-            article_count=99,
-            category_count=15,
-            rpg_system="Starfinder",
-            created_at=created,
-            updated_at=created,
-            owner=owner,
-        )
-        data = world.model_dump()
-        assert data["id"] == "world333"
-        assert data["name"] == "Complete World"
-        assert data["genre"] == "Sci-Fi"
-        assert data["article_count"] == 99
-        assert data["owner"] == owner
-
-    def test_world_partial_fields(self) -> None:
-        """Test World with some optional fields provided."""
-        world = World(
-            id="world444",
-            name="Partial World",
-            description="Only some fields",
-            genre="Horror",
-            # article_count omitted
-            category_count=5,
-            rpg_system="Call of Cthulhu",
-        )
-        assert world.description == "Only some fields"
-        assert world.genre == "Horror"
-        assert world.category_count == 5
-        assert world.rpg_system == "Call of Cthulhu"
-        assert world.article_count is None
-
     def test_world_missing_required_field(self) -> None:
         """Test World validation fails without required field."""
         with pytest.raises(ValueError, match="Field required"):
@@ -8,6 +8,7 @@ Tests InMemoryCache and CacheEntry components including:
 - Statistics tracking
 """
 
+import asyncio
 import time
 from unittest.mock import patch
 
@@ -23,7 +24,7 @@ class TestCacheEntry:
     def test_cache_entry_creation(self) -> None:
         """Test creating a CacheEntry with value and expiration."""
         # Arrange
-        expires_at = time.time() + 300
+        expires_at = time.monotonic() + 300
 
         # Act
         entry = CacheEntry(value={"key": "value"}, expires_at=expires_at)
@@ -36,7 +37,7 @@ class TestCacheEntry:
     def test_cache_entry_with_any_value_type(self) -> None:
         """Test CacheEntry stores any value type."""
         # Arrange
-        expires_at = time.time() + 300
+        expires_at = time.monotonic() + 300
 
         # Act & Assert - string
         entry_str = CacheEntry(value="test", expires_at=expires_at)
@@ -104,6 +105,25 @@ class TestInMemoryCacheBasics:
         # Assert
         assert result is None
 
+    @pytest.mark.unit
+    def test_cache_get_first_returns_first_valid_key(self) -> None:
+        """Test get_first falls back to later keys and counts one hit."""
+        # Arrange
+        cache = InMemoryCache()
+        cache.set("world:abc:2", "detailed")
+        cache.set("world:abc:3", "full")
+
+        # Act
+        result = cache.get_first(["world:abc:1", "world:abc:2", "world:abc:3"])
+        missing = cache.get_first(["world:xyz:1", "world:xyz:2"])
+
+        # Assert
+        assert result == "detailed"
+        assert missing is None
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
     @pytest.mark.unit
     def test_cache_set_overwrites_existing_key(self) -> None:
         """Test set overwrites value for existing key."""
@@ -370,6 +390,41 @@ class TestInMemoryCacheLRU:
         assert cache.get("a") is None
         assert cache.get("b") == 2
 
+    @pytest.mark.unit
+    def test_cache_clock_eviction_spares_visited_entries(self) -> None:
+        """Test CLOCK eviction gives read entries a second chance."""
+        # Arrange
+        cache = InMemoryCache(max_entries=2, eviction="clock")
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        # Act - read "a" without reordering, then add "c"
+        cache.get("a")
+        cache.set("c", 3)
+
+        # Assert - "b" was never read, so it is evicted instead of "a"
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    @pytest.mark.unit
+    def test_cache_clock_eviction_all_visited(self) -> None:
+        """Test CLOCK eviction terminates when every entry was read."""
+        # Arrange
+        cache = InMemoryCache(max_entries=2, eviction="clock")
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.get("b")
+
+        # Act
+        cache.set("c", 3)
+
+        # Assert - flags cleared in one pass, oldest entry evicted
+        assert len(cache._cache) == 2
+        assert cache.get("a") is None
+        assert cache.get("c") == 3
+
 
 class TestInMemoryCachePatternInvalidation:
     """Tests for pattern-based key invalidation."""
@@ -480,6 +535,97 @@ class TestInMemoryCachePatternInvalidation:
         for i in range(5, 10):
             assert cache.get(f"key:{i}") == i
 
+    @pytest.mark.unit
+    def test_invalidate_pattern_wide_match_preserves_lru_order(self) -> None:
+        """Test invalidating most keys keeps the survivors in LRU order."""
+        # Arrange
+        cache = InMemoryCache()
+        cache.set("keep:a", 1)
+        cache.set("drop:1", 2)
+        cache.set("keep:b", 3)
+        cache.set("drop:2", 4)
+        cache.set("drop:3", 5)
+
+        # Act
+        removed = cache.invalidate_pattern(r"drop:.*")
+
+        # Assert
+        assert removed == 3
+        assert list(cache._cache) == ["keep:a", "keep:b"]
+        assert cache.invalidate_tag("drop") == 0
+
+
+class TestInMemoryCacheTagInvalidation:
+    """Tests for tag-indexed key invalidation."""
+
+    @pytest.mark.unit
+    def test_invalidate_tag_removes_tagged_keys(self) -> None:
+        """Test invalidate_tag removes keys containing the tag segment."""
+        # Arrange
+        cache = InMemoryCache()
+        cache.set("world:abc:1", "val1")
+        cache.set("world:def:2", "val2")
+        cache.set("worlds:list:1", "val3")
+        cache.set("user:self:1", "val4")
+
+        # Act
+        removed = cache.invalidate_tag("world")
+
+        # Assert
+        assert removed == 2
+        assert cache.get("world:abc:1") is None
+        assert cache.get("world:def:2") is None
+        assert cache.get("worlds:list:1") == "val3"
+        assert cache.get("user:self:1") == "val4"
+
+    @pytest.mark.unit
+    def test_invalidate_tag_no_matches(self) -> None:
+        """Test invalidate_tag returns 0 for an unknown tag."""
+        # Arrange
+        cache = InMemoryCache()
+        cache.set("world:abc:1", "val")
+
+        # Act
+        removed = cache.invalidate_tag("article")
+
+        # Assert
+        assert removed == 0
+        assert cache.get("world:abc:1") == "val"
+
+    @pytest.mark.unit
+    def test_tag_index_only_holds_resource_types(self) -> None:
+        """Test IDs and other later key segments are not indexed as tags."""
+        # Arrange
+        cache = InMemoryCache()
+        cache.set("world:abc:1", "val1")
+        cache.set("world:def:2", "val2")
+        cache.set("worlds:list:1", "val3")
+
+        # Act
+        removed = cache.invalidate_tag("abc")
+
+        # Assert
+        assert removed == 0
+        assert set(cache._tag_index) == {"world", "worlds"}
+
+    @pytest.mark.unit
+    def test_invalidate_tag_skips_evicted_and_removed_keys(self) -> None:
+        """Test the tag index forgets keys removed by other paths."""
+        # Arrange
+        cache = InMemoryCache(max_entries=2)
+        cache.set("world:a:1", 1)
+        cache.set("world:b:1", 2)
+        cache.set("world:c:1", 3)  # Evicts world:a:1
+        cache.invalidate("world:b:1")
+
+        # Act
+        removed = cache.invalidate_tag("world")
+
+        # Assert
+        assert removed == 1
+        assert len(cache._cache) == 0
+        assert not cache._tag_index
+
 
 class TestInMemoryCacheStats:
     """Tests for statistics tracking."""
@@ -584,6 +730,52 @@ class TestInMemoryCacheStats:
         assert stats["expired"] == 0
         assert stats["max_entries"] == 500
 
+    @pytest.mark.unit
+    def test_stats_tracks_hits_misses_and_evictions(self) -> None:
+        """Test stats reports lookup and eviction counters."""
+        # Arrange
+        cache = InMemoryCache(max_entries=1)
+        cache.set("a", 1)
+        cache.set("b", 2, ttl=0)  # Evicts "a", expires immediately
+
+        # Act
+        cache.get("a")  # Miss (evicted)
+        cache.get("b")  # Miss (expired)
+        cache.set("c", 3)
+        cache.get("c")  # Hit
+        stats = cache.stats()
+
+        # Assert
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+        assert stats["evictions"] == 1
+        assert stats["expirations"] == 1
+        assert stats["hit_rate"] == pytest.approx(1 / 3)
+
+
+class TestInMemoryCacheSweep:
+    """Tests for the background expiry sweep."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_sweep_removes_expired_entries(self) -> None:
+        """Test sweep drops expired entries without them being read."""
+        # Arrange
+        cache = InMemoryCache()
+        cache.set("world:abc:1", "stale", ttl=0)
+        cache.set("world:def:1", "fresh", ttl=60)
+
+        # Act
+        task = asyncio.create_task(cache.sweep(interval=0.01))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        # Assert
+        assert list(cache._cache) == ["world:def:1"]
+        assert cache._tag_index["world"] == {"world:def:1"}
+
 
 class TestInMemoryCacheEdgeCases:
     """Tests for edge cases and boundary conditions."""
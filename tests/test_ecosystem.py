@@ -8,6 +8,7 @@ Tests EcosystemDetector including:
 - Ecosystem status reporting
 """
 
+from dataclasses import FrozenInstanceError
 from unittest.mock import Mock
 
 import pytest
@@ -48,6 +49,16 @@ class TestIntegrationTier:
         assert IntegrationTier.CRITICAL.value < IntegrationTier.RECOMMENDED.value
         assert IntegrationTier.RECOMMENDED.value < IntegrationTier.OPTIONAL.value
 
+    @pytest.mark.unit
+    def test_tiers_sort_directly(self) -> None:
+        """Test tiers compare as integers without going through .value."""
+        # Act
+        tiers = sorted([IntegrationTier.OPTIONAL, IntegrationTier.CRITICAL])
+
+        # Assert
+        assert tiers == [IntegrationTier.CRITICAL, IntegrationTier.OPTIONAL]
+        assert IntegrationTier.CRITICAL < IntegrationTier.RECOMMENDED
+
     @pytest.mark.unit
     def test_tier_enum_members(self) -> None:
         """Test all expected tier members exist."""
@@ -73,7 +84,7 @@ class TestCompanionMCP:
             name="Test MCP",
             tier=IntegrationTier.RECOMMENDED,
             description="Test description",
-            detection_tools=["tool1", "tool2"],
+            detection_tools=frozenset({"tool1", "tool2"}),
             use_cases=["use case 1"],
         )
 
@@ -81,7 +92,7 @@ class TestCompanionMCP:
         assert companion.name == "Test MCP"
         assert companion.tier == IntegrationTier.RECOMMENDED
         assert companion.description == "Test description"
-        assert companion.detection_tools == ["tool1", "tool2"]
+        assert companion.detection_tools == frozenset({"tool1", "tool2"})
         assert companion.use_cases == ["use case 1"]
 
     @pytest.mark.unit
@@ -92,7 +103,7 @@ class TestCompanionMCP:
             name="Full MCP",
             tier=IntegrationTier.CRITICAL,
             description="Full description",
-            detection_tools=["tool1"],
+            detection_tools=frozenset({"tool1"}),
             use_cases=["use case"],
             documentation_url="https://example.com/docs",
             can_read=True,
@@ -117,7 +128,7 @@ class TestCompanionMCP:
             name="Default MCP",
             tier=IntegrationTier.OPTIONAL,
             description="Description",
-            detection_tools=["tool"],
+            detection_tools=frozenset({"tool"}),
             use_cases=["use case"],
         )
 
@@ -128,6 +139,16 @@ class TestCompanionMCP:
         assert companion.documentation_url is None
         assert companion.workflow_suggestions == {}
 
+    @pytest.mark.unit
+    def test_companion_is_immutable(self) -> None:
+        """Test CompanionMCP fields cannot be reassigned."""
+        # Arrange
+        companion = COMPANION_REGISTRY[0]
+
+        # Act & Assert
+        with pytest.raises(FrozenInstanceError):
+            companion.name = "Renamed"  # type: ignore[misc]
+
     @pytest.mark.unit
     def test_companion_empty_workflow_suggestions(self) -> None:
         """Test CompanionMCP with empty workflow suggestions."""
@@ -136,12 +157,14 @@ class TestCompanionMCP:
             name="No Suggestions",
             tier=IntegrationTier.OPTIONAL,
             description="Desc",
-            detection_tools=["tool"],
+            detection_tools=frozenset({"tool"}),
             use_cases=["use case"],
         )
 
         # Assert
         assert companion.workflow_suggestions == {}
+        with pytest.raises(TypeError):
+            companion.workflow_suggestions["workflow"] = "hint"  # type: ignore[index]
 
 
 class TestEcosystemDetectorInitialization:
@@ -190,6 +213,34 @@ class TestEcosystemDetectorInitialization:
         assert isinstance(detector.available_tools, set)
         assert len(detector.available_tools) == 2
 
+    @pytest.mark.unit
+    def test_detector_uses_tool_set_without_copying(self) -> None:
+        """Test a set of tools is used as is rather than copied."""
+        # Arrange
+        tools = frozenset({"foundry_get_actors", "dropbox_upload"})
+
+        # Act
+        detector = EcosystemDetector(available_tools=tools)
+
+        # Assert
+        assert detector.available_tools is tools
+        assert detector.has("Foundry VTT")
+        assert detector.has("Dropbox")
+
+    @pytest.mark.unit
+    def test_for_tools_shares_detector_per_tool_set(self) -> None:
+        """Test for_tools returns one detector per distinct tool set."""
+        # Act
+        first = EcosystemDetector.for_tools(["foundry_get_actors", "dropbox_upload"])
+        second = EcosystemDetector.for_tools(["dropbox_upload", "foundry_get_actors"])
+        other = EcosystemDetector.for_tools(["dropbox_upload"])
+
+        # Assert
+        assert first is second
+        assert other is not first
+        assert first.has("Foundry VTT")
+        assert not other.has("Foundry VTT")
+
 
 class TestEcosystemDetectorDetection:
     """Tests for companion detection logic."""
@@ -476,6 +527,22 @@ class TestEcosystemDetectorWorkflowSuggestions:
         # Assert
         assert len(suggestions) == 0
 
+    @pytest.mark.unit
+    def test_suggest_for_workflow_prefix(self) -> None:
+        """Test prefix queries cover every matching workflow, sorted by tier."""
+        # Act
+        detector = EcosystemDetector(
+            available_tools=[
+                "discord_send_message",  # OPTIONAL, session_notes
+                "notion_search",  # RECOMMENDED, session_prep, campaign_setup
+            ]
+        )
+        suggestions = detector.suggest_for_workflow_prefix("session_")
+
+        # Assert
+        assert [s[0] for s in suggestions] == ["Notion", "Discord"]
+        assert detector.suggest_for_workflow_prefix("nonexistent") == []
+
 
 class TestEcosystemDetectorStatusReport:
     """Tests for ecosystem status reporting."""
@@ -556,6 +623,20 @@ class TestEcosystemDetectorStatusReport:
         assert "Dropbox" in status
         assert "Discord" in status
 
+    @pytest.mark.unit
+    def test_status_report_built_once(self) -> None:
+        """Test repeated status calls reuse the first report."""
+        # Arrange
+        detector = EcosystemDetector(available_tools=["foundry_get_actors"])
+
+        # Act
+        first = detector.get_ecosystem_status()
+        second = detector.get_ecosystem_status()
+
+        # Assert
+        assert first is second
+        assert detector.ecosystem_status is first
+
 
 class TestEcosystemDetectorCompanionRegistry:
     """Tests for companion registry validation."""
@@ -605,6 +686,15 @@ class TestEcosystemDetectorCompanionRegistry:
         for companion in COMPANION_REGISTRY:
             assert len(companion.detection_tools) > 0
 
+    @pytest.mark.unit
+    def test_companion_registry_detection_tools_unique(self) -> None:
+        """Test no detection tool is shared between registry companions."""
+        # Act
+        tools = [tool for c in COMPANION_REGISTRY for tool in c.detection_tools]
+
+        # Assert
+        assert len(tools) == len(set(tools))
+
     @pytest.mark.unit
     def test_companion_registry_all_have_use_cases(self) -> None:
         """Test all registry companions have use cases."""
@@ -694,3 +784,17 @@ class TestEcosystemDetectorEdgeCases:
         assert list1 == list2
         assert isinstance(list1, list)
         assert isinstance(list2, list)
+
+    @pytest.mark.unit
+    def test_query_results_do_not_alias_indexes(self) -> None:
+        """Test mutating returned lists leaves the detector's indexes intact."""
+        # Arrange
+        detector = EcosystemDetector(available_tools=["foundry_get_actors"])
+
+        # Act
+        detector.critical_companions.clear()
+        detector.suggest_for_workflow("session_prep").clear()
+
+        # Assert
+        assert len(detector.critical_companions) == 1
+        assert len(detector.suggest_for_workflow("session_prep")) == 1
@@ -7,6 +7,8 @@ Tests custom exception classes including:
 - Status codes and retry-after values
 """
 
+import pickle
+
 import pytest
 
 from world_anvil_mcp.exceptions import (
@@ -214,6 +216,16 @@ class TestWorldAnvilAPIError:
         # Assert
         assert error.status_code == -1
 
+    @pytest.mark.unit
+    def test_api_error_pickle_keeps_status_code(self) -> None:
+        """Test status_code survives a pickle round trip."""
+        # Act
+        error = pickle.loads(pickle.dumps(WorldAnvilAPIError("Server error", 503)))  # noqa: S301
+
+        # Assert
+        assert str(error) == "Server error"
+        assert error.status_code == 503
+
 
 class TestWorldAnvilRateLimitError:
     """Tests for rate limit exceeded error."""
@@ -326,6 +338,16 @@ class TestWorldAnvilRateLimitError:
         # Assert
         assert error.retry_after == -1
 
+    @pytest.mark.unit
+    def test_rate_limit_error_pickle_keeps_retry_after(self) -> None:
+        """Test retry_after survives a pickle round trip."""
+        # Act
+        error = pickle.loads(pickle.dumps(WorldAnvilRateLimitError("Limited", 30)))  # noqa: S301
+
+        # Assert
+        assert str(error) == "Limited"
+        assert error.retry_after == 30
+
 
 class TestWorldAnvilNotFoundError:
     """Tests for resource not found error."""
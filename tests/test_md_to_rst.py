@@ -0,0 +1,263 @@
+"""Tests for the markdown to RST documentation converter script.
+
+Tests scripts/md_to_rst.py including:
+- Keeping documents that share headings out of the same batch
+- Batch output matching per-file conversion
+- Falling back to per-file conversion when the batch output cannot be split
+- Skipping sources unchanged since their last conversion
+- Writing RST output only when it changed
+"""
+
+import importlib.util
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+SCRIPT = Path(__file__).parent.parent / "scripts" / "md_to_rst.py"
+
+
+@pytest.fixture
+def md_to_rst(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+    """Load the converter script with its paths redirected into tmp_path."""
+    spec = importlib.util.spec_from_file_location("md_to_rst", SCRIPT)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, "md_to_rst", module)
+    spec.loader.exec_module(module)
+
+    monkeypatch.setattr(module, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(module, "SPHINX_SOURCE", tmp_path / "source")
+    monkeypatch.setattr(module, "CACHE_FILE", tmp_path / "build" / "cache.json")
+    return module
+
+
+class TestSplitBatches:
+    """Tests for grouping documents into independent batches."""
+
+    @pytest.mark.unit
+    def test_shared_headings_go_to_separate_batches(self, md_to_rst: ModuleType) -> None:
+        """Test documents repeating a heading are never batched together."""
+        # Arrange
+        sources = [
+            (Path("a.md"), "# Alpha\n\n## Overview\n"),
+            (Path("b.md"), "# Beta\n\n## 1. Overview\n"),
+            (Path("c.md"), "# Gamma\n\nSee [alpha].\n"),
+            (Path("d.md"), "Delta\n=====\n"),
+        ]
+
+        # Act
+        batches = md_to_rst._split_batches(sources)
+
+        # Assert
+        names = [[src.name for src, _ in batch] for batch in batches]
+        assert names == [["a.md", "d.md"], ["b.md", "c.md"]]
+
+
+class TestConvertBatch:
+    """Tests for converting several documents in batched pandoc runs."""
+
+    @pytest.mark.integration
+    @pytest.mark.skipif(shutil.which("pandoc") is None, reason="pandoc not installed")
+    def test_batch_output_matches_per_file_conversion(
+        self,
+        md_to_rst: ModuleType,
+        tmp_path: Path,
+    ) -> None:
+        """Test batched documents split back into their own per-file RST."""
+        # Arrange
+        documents = {
+            "setup.md": "# Setup\n\n## Overview\n\nInstall *everything*.\n",
+            "usage.md": "# Usage\n\n## Overview\n\nRun it — see [setup].\n",
+            "notes.md": "# Notes\n\n- Ünïcode bullet\n- `code`\n",
+        }
+        pairs = []
+        for name, text in documents.items():
+            src = tmp_path / name
+            src.write_text(text, encoding="utf-8")
+            pairs.append((src, tmp_path / name.replace(".md", ".rst")))
+
+        # Act
+        rendered = md_to_rst._convert_batch(pairs)
+
+        # Assert
+        assert set(rendered) == {src for src, _ in pairs}
+        for src, dst in pairs:
+            assert md_to_rst._run_pandoc(src, dst) is None
+            assert rendered[src] == dst.read_text(encoding="utf-8")
+
+
+class TestConvertAll:
+    """Tests for batch conversion and its per-file fallback."""
+
+    @pytest.mark.unit
+    def test_unsplittable_batch_falls_back_to_per_file(
+        self,
+        md_to_rst: ModuleType,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test a batch that does not split per file is converted file by file."""
+        # Arrange
+        sources = []
+        for name in ("a.md", "b.md"):
+            src = tmp_path / name
+            src.write_text(f"# {name}\n\n```\nunclosed fence\n", encoding="utf-8")
+            sources.append(src)
+
+        def fake_run(args: list[str], **kwargs: object) -> subprocess.CompletedProcess[str]:
+            # Sentinel swallowed: the whole batch comes back as a single slice
+            return subprocess.CompletedProcess(args, 0, stdout="one slice\n", stderr="")
+
+        converted: list[Path] = []
+
+        def fake_run_pandoc(md_file: Path, rst_file: Path) -> str | None:
+            converted.append(md_file)
+            return None
+
+        monkeypatch.setattr(md_to_rst.subprocess, "run", fake_run)
+        monkeypatch.setattr(md_to_rst, "_run_pandoc", fake_run_pandoc)
+        conversions = [
+            ("docs", src, tmp_path / "source" / src.name.replace(".md", ".rst")) for src in sources
+        ]
+
+        # Act
+        result = md_to_rst.convert_all(conversions)
+
+        # Assert
+        assert result == (2, 0, 0)
+        assert sorted(converted) == sources
+        assert not (tmp_path / "source").exists()  # Nothing written from the batch
+
+
+class TestSkipUnchanged:
+    """Tests for skipping sources whose RST output is already current."""
+
+    @pytest.fixture
+    def convert(
+        self,
+        md_to_rst: ModuleType,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> tuple[Path, list[Path]]:
+        """Create one source and record which files later runs convert."""
+        src = tmp_path / "guide.md"
+        src.write_text("# Guide\n", encoding="utf-8")
+        converted: list[Path] = []
+
+        def fake_run_pandoc(md_file: Path, rst_file: Path) -> str | None:
+            converted.append(md_file)
+            md_to_rst._write_if_changed(rst_file, md_file.read_bytes())
+            return None
+
+        monkeypatch.setattr(md_to_rst, "_convert_batch", lambda _pairs: {})
+        monkeypatch.setattr(md_to_rst, "_run_pandoc", fake_run_pandoc)
+        return src, converted
+
+    @staticmethod
+    def _run(md_to_rst: ModuleType, src: Path) -> tuple[int, int, int]:
+        """Run convert_all over the single source."""
+        dst = md_to_rst.SPHINX_SOURCE / "guide.rst"
+        return md_to_rst.convert_all([("docs", src, dst)])
+
+    @staticmethod
+    def _touch_newer(md_to_rst: ModuleType, src: Path) -> None:
+        """Give the source an mtime later than its RST output."""
+        rst_mtime = (md_to_rst.SPHINX_SOURCE / "guide.rst").stat().st_mtime
+        os.utime(src, (rst_mtime + 10, rst_mtime + 10))
+
+    @pytest.mark.unit
+    def test_unchanged_file_is_skipped(
+        self,
+        md_to_rst: ModuleType,
+        convert: tuple[Path, list[Path]],
+    ) -> None:
+        """Test a source older than its RST output is not converted again."""
+        # Arrange
+        src, converted = convert
+        self._run(md_to_rst, src)
+
+        # Act
+        result = self._run(md_to_rst, src)
+
+        # Assert
+        assert result == (0, 1, 0)
+        assert converted == [src]
+
+    @pytest.mark.unit
+    def test_touched_file_with_same_content_is_skipped(
+        self,
+        md_to_rst: ModuleType,
+        convert: tuple[Path, list[Path]],
+    ) -> None:
+        """Test a newer mtime alone is caught by the content hash check."""
+        # Arrange
+        src, converted = convert
+        self._run(md_to_rst, src)
+        self._touch_newer(md_to_rst, src)
+
+        # Act
+        result = self._run(md_to_rst, src)
+
+        # Assert
+        assert result == (0, 1, 0)
+        assert converted == [src]
+
+    @pytest.mark.unit
+    def test_changed_file_is_converted_again(
+        self,
+        md_to_rst: ModuleType,
+        convert: tuple[Path, list[Path]],
+    ) -> None:
+        """Test a source whose content changed is converted on the next run."""
+        # Arrange
+        src, converted = convert
+        self._run(md_to_rst, src)
+        src.write_text("# Guide\n\nNew section.\n", encoding="utf-8")
+        self._touch_newer(md_to_rst, src)
+
+        # Act
+        result = self._run(md_to_rst, src)
+
+        # Assert
+        assert result == (1, 0, 0)
+        assert converted == [src, src]
+        assert md_to_rst.CACHE_FILE.exists()
+
+
+class TestWriteIfChanged:
+    """Tests for leaving identical RST output untouched on disk."""
+
+    @pytest.mark.unit
+    def test_identical_content_keeps_mtime(self, md_to_rst: ModuleType, tmp_path: Path) -> None:
+        """Test rewriting the same bytes does not touch the file."""
+        # Arrange
+        rst_file = tmp_path / "source" / "guide.rst"
+        md_to_rst._write_if_changed(rst_file, b"Guide\n=====\n")
+        os.utime(rst_file, (1_000_000, 1_000_000))
+
+        # Act
+        md_to_rst._write_if_changed(rst_file, b"Guide\n=====\n")
+
+        # Assert
+        assert rst_file.stat().st_mtime == 1_000_000
+
+    @pytest.mark.unit
+    def test_different_content_rewrites_file(self, md_to_rst: ModuleType, tmp_path: Path) -> None:
+        """Test new bytes replace the file and update its mtime."""
+        # Arrange
+        rst_file = tmp_path / "source" / "guide.rst"
+        md_to_rst._write_if_changed(rst_file, b"Guide\n=====\n")
+        os.utime(rst_file, (1_000_000, 1_000_000))
+
+        # Act
+        md_to_rst._write_if_changed(rst_file, b"Guide\n=====\n\nUpdated.\n")
+
+        # Assert
+        assert rst_file.read_bytes() == b"Guide\n=====\n\nUpdated.\n"
+        assert rst_file.stat().st_mtime > 1_000_000
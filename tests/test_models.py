@@ -8,13 +8,17 @@ Tests models including:
 - extra="allow" configuration for API flexibility
 """
 
-from datetime import datetime
+from datetime import UTC, datetime
 
 import pytest
 
 from world_anvil_mcp.models.user import Identity, User
 from world_anvil_mcp.models.world import World, WorldSummary
 
+# Expected values for the timestamp strings parsed below
+_JAN_15 = datetime.fromisoformat("2023-01-15T10:30:00")
+_JUNE_20 = datetime.fromisoformat("2023-06-20T15:45:30")
+
 
 class TestIdentityModel:
     """Tests for Identity Pydantic model."""
@@ -211,13 +215,7 @@ class TestUserModel:
         user = User(**data)
 
         # Assert
-        assert isinstance(user.created_at, datetime)
-        assert user.created_at.year == 2023
-        assert user.created_at.month == 6
-        assert user.created_at.day == 20
-        assert user.created_at.hour == 15
-        assert user.created_at.minute == 45
-        assert user.created_at.second == 30
+        assert user.created_at == _JUNE_20
 
     @pytest.mark.unit
     def test_user_datetime_with_microseconds(self) -> None:
@@ -233,8 +231,7 @@ class TestUserModel:
         user = User(**data)
 
         # Assert
-        assert isinstance(user.created_at, datetime)
-        assert user.created_at.microsecond == 123456
+        assert user.created_at == _JUNE_20.replace(microsecond=123456)
 
     @pytest.mark.unit
     def test_user_datetime_with_timezone(self) -> None:
@@ -250,8 +247,7 @@ class TestUserModel:
         user = User(**data)
 
         # Assert
-        assert isinstance(user.created_at, datetime)
-        assert user.created_at.year == 2023
+        assert user.created_at == _JUNE_20.replace(tzinfo=UTC)
 
     @pytest.mark.unit
     def test_user_datetime_object(self) -> None:
@@ -509,12 +505,8 @@ class TestWorldModel:
         world = World(**data)
 
         # Assert
-        assert isinstance(world.created_at, datetime)
-        assert isinstance(world.updated_at, datetime)
-        assert world.created_at.year == 2023
-        assert world.created_at.month == 1
-        assert world.updated_at.year == 2023
-        assert world.updated_at.month == 6
+        assert world.created_at == _JAN_15
+        assert world.updated_at == _JUNE_20
 
     @pytest.mark.unit
     def test_world_article_count_int(self) -> None:
@@ -707,6 +699,19 @@ class TestModelExtraFieldsConfiguration:
             config = model.model_config
             assert config.get("extra") == "allow"
 
+    @pytest.mark.unit
+    def test_all_models_are_frozen(self) -> None:
+        """Test parsed responses cannot be modified after validation."""
+        # Arrange
+        models = [Identity, User, WorldSummary, World]
+        identity = Identity(id="user123", username="testuser")
+
+        # Act & Assert
+        for model in models:
+            assert model.model_config.get("frozen") is True
+        with pytest.raises(ValueError, match="frozen"):
+            identity.username = "renamed"
+
     @pytest.mark.unit
     def test_extra_fields_preserved_in_dict(self) -> None:
         """Test extra fields are preserved when serialized to dict."""
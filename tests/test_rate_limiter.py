@@ -0,0 +1,68 @@
+"""Tests for the token-bucket rate limiter.
+
+Tests TokenBucket including:
+- Immediate acquisition while tokens remain
+- Waiting for refill once the bucket is empty
+- Refill capped at capacity
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from world_anvil_mcp.rate_limiter import TokenBucket
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket acquisition and refill."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_acquire_within_capacity_is_immediate(self) -> None:
+        """Test a full bucket serves a burst up to capacity without waiting."""
+        # Arrange
+        limiter = TokenBucket(rate=5, per=60.0)
+
+        # Act
+        start = time.monotonic()
+        for _ in range(5):
+            await limiter.acquire()
+        elapsed = time.monotonic() - start
+
+        # Assert
+        assert elapsed < 0.05
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_acquire_waits_when_empty(self) -> None:
+        """Test acquiring past capacity waits for a refill."""
+        # Arrange
+        limiter = TokenBucket(rate=2, per=0.2)  # One token per 0.1s
+        await limiter.acquire()
+        await limiter.acquire()
+
+        # Act
+        start = time.monotonic()
+        await limiter.acquire()
+        elapsed = time.monotonic() - start
+
+        # Assert
+        assert elapsed >= 0.09
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_refill_capped_at_capacity(self) -> None:
+        """Test idle time does not accumulate tokens beyond capacity."""
+        # Arrange
+        limiter = TokenBucket(rate=1, per=0.05)
+
+        # Act
+        await asyncio.sleep(0.2)
+        await limiter.acquire()
+        start = time.monotonic()
+        await limiter.acquire()
+        elapsed = time.monotonic() - start
+
+        # Assert
+        assert elapsed >= 0.04